@@ -3,12 +3,22 @@ Configuration manager for the trading bot.
 """
 
 import os
+import copy
 import logging
 import yaml
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml parser when PyYAML was built with it
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+# Parsed configuration files, keyed by path, with the modification time they were read at
+_parsed_configs: Dict[str, tuple] = {}
+
 class ConfigManager:
     """
     Manages configuration settings for the trading bot.
@@ -35,8 +45,15 @@ class ConfigManager:
         """
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f)
+                # Reuse the parsed file while it is unchanged; each manager gets its own copy
+                # because set() modifies the dictionary
+                path = os.path.abspath(self.config_path)
+                mtime = os.path.getmtime(path)
+                cached = _parsed_configs.get(path)
+                if cached is None or cached[0] != mtime:
+                    with open(path, 'r') as f:
+                        cached = _parsed_configs[path] = (mtime, yaml.load(f, Loader=_YamlLoader))
+                self.config = copy.deepcopy(cached[1])
             except Exception as e:
                 logger.error(f"Error loading configuration: {e}")
                 self.config = {}
@@ -5,8 +5,8 @@ Module for initializing and managing the data collection components.
 import logging
 from typing import Dict, List, Any, Optional
 import pandas as pd
-import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
                 
 from src.data_collection.binance_data_provider import BinanceDataProvider
 from src.data_collection.data_preprocessor import DataPreprocessor
@@ -28,6 +28,8 @@ class DataCollectionModule:
         self.config = config
         self.data_provider = BinanceDataProvider(config)
         self.preprocessor = DataPreprocessor()
+        # ThreadPoolExecutor needs at least one worker
+        self.max_fetch_workers = max(1, int(config.get('data', 'max_fetch_workers', default=4)))
         logger.info("Data collection module initialized")
     
     def get_top_trading_pairs(self, limit: int = 10) -> List[str]:
@@ -70,40 +72,60 @@ class DataCollectionModule:
         """
         historical_data = {}
         
-        for symbol in trading_pairs:
-            try:
-                now = dt.datetime.now(dt.timezone.utc)
-                past = now - dt.timedelta(days=days)
-            
-                # Get historical data
-                data = self.data_provider.get_historical_data(
-                    symbol=symbol,
-                    interval=interval,
-                    start_time=past,
-                    end_time=now,
-                    limit=days * 24  # Approximate number of candles
-                )
-                
-                # Preprocess data
-                if not data.empty:
-                    # Calculate returns
-                    data = self.preprocessor.calculate_returns(data)
-                    
-                    # Add to result
+        if not trading_pairs:
+            return historical_data
+        
+        # Requests are I/O bound, so fetch the pairs concurrently
+        max_workers = min(self.max_fetch_workers, len(trading_pairs))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(lambda symbol: self._fetch_historical_data(symbol, interval, days), trading_pairs)
+            
+            for symbol, data in zip(trading_pairs, results):
+                if data is not None:
                     historical_data[symbol] = data
-                    
-                    logger.info(f"Retrieved and preprocessed {len(data)} candles for {symbol}")
-                else:
-                    logger.warning(f"Empty data for {symbol}")
-                
-                # Add a small delay to avoid rate limits
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Error getting historical data for {symbol}: {e}")
         
         return historical_data
     
+    def _fetch_historical_data(self, symbol: str, interval: str, days: int) -> Optional[pd.DataFrame]:
+        """
+        Fetch and preprocess historical data for a single trading pair.
+        
+        Args:
+            symbol: Trading pair symbol
+            interval: Candlestick interval
+            days: Number of days of historical data
+            
+        Returns:
+            Preprocessed DataFrame, or None if no data could be retrieved
+        """
+        try:
+            now = dt.datetime.now(dt.timezone.utc)
+            past = now - dt.timedelta(days=days)
+        
+            # Get historical data
+            data = self.data_provider.get_historical_data(
+                symbol=symbol,
+                interval=interval,
+                start_time=past,
+                end_time=now,
+                limit=days * 24  # Approximate number of candles
+            )
+            
+            # Preprocess data
+            if not data.empty:
+                # Calculate returns
+                data = self.preprocessor.calculate_returns(data)
+                
+                logger.info(f"Retrieved and preprocessed {len(data)} candles for {symbol}")
+                return data
+            
+            logger.warning(f"Empty data for {symbol}")
+            
+        except Exception as e:
+            logger.error(f"Error getting historical data for {symbol}: {e}")
+        
+        return None
+    
     def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """
         Get current prices for multiple symbols.
@@ -29,15 +29,12 @@ class DataPreprocessor:
         Returns:
             Preprocessed DataFrame
         """
-        # Make a copy to avoid modifying the original
-        df = df.copy()
+        # Keep only the OHLCV columns before parsing, so unused kline fields are never converted
+        columns_to_keep = ['open', 'high', 'low', 'close', 'volume']
+        df = df[[col for col in df.columns if col in columns_to_keep or col == 'timestamp']].copy()
         
         # Convert types
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume', 
-                          'quote_asset_volume', 'taker_buy_base_asset_volume', 
-                          'taker_buy_quote_asset_volume']
-        
-        for col in numeric_columns:
+        for col in columns_to_keep:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         
@@ -46,12 +43,6 @@ class DataPreprocessor:
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
             df.set_index('timestamp', inplace=True)
         
-        # Drop unnecessary columns
-        columns_to_keep = ['open', 'high', 'low', 'close', 'volume']
-        extra_columns = [col for col in df.columns if col not in columns_to_keep and col != 'timestamp']
-        if extra_columns:
-            df.drop(columns=extra_columns, inplace=True)
-        
         # Rename columns to standard format
         df.columns = [col.capitalize() for col in df.columns]
         
@@ -3,7 +3,7 @@ Module for initializing and managing the execution components.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Sequence
 import pandas as pd
 
 from src.execution.order_executor import OrderExecutor
@@ -11,6 +11,7 @@ from src.execution.binance_executor import BinanceExecutor
 from src.execution.paper_trading_executor import PaperTradingExecutor
 from src.execution.position_manager import PositionManager
 from src.risk_management.risk_manager import RiskManager
+from src.strategy import Opportunity
 
 logger = logging.getLogger(__name__)
 
@@ -44,68 +45,53 @@ class ExecutionModule:
         
         logger.info(f"Execution module initialized in {self.trading_mode} mode")
     
-    def execute_signals(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def execute_signals(self, signals: Sequence[Opportunity]) -> List[Dict[str, Any]]:
         """
         Execute trading signals.
         
         Args:
-            signals: List of trading signals
+            signals: Trading opportunities from the strategy module
             
         Returns:
             List of executed positions
         """
         executed_positions = []
-        
-        for signal in signals:
+        signals = [signal for signal in signals if signal.type in ('buy', 'sell')]
+        if not signals:
+            return executed_positions
+        
+        sides = ['LONG' if signal.type == 'buy' else 'SHORT' for signal in signals]
+        quantities = [self.risk_manager.calculate_position_size(signal.symbol, side, signal.price)
+                      for signal, side in zip(signals, sides)]
+        
+        # Screen all signals against the risk limits in one pass
+        approved = self.risk_manager.check_orders_batch(
+            quantities,
+            [signal.price for signal in signals],
+            open_positions=len(self.position_manager.get_open_positions())
+        )
+        
+        for signal, side, quantity, allowed in zip(signals, sides, quantities, approved):
+            if not allowed:
+                logger.warning(f"Signal for {signal.symbol} rejected by risk manager")
+                continue
+            
             try:
-                symbol = signal['symbol']
-                signal_type = signal['type']
-                price = signal.get('price')
+                # Open the position
+                position = self.position_manager.open_position(
+                    symbol=signal.symbol,
+                    side=side,
+                    quantity=quantity,
+                    price=signal.price,
+                    stop_loss=signal.stop_loss,
+                    take_profit=signal.take_profit
+                )
+                
+                executed_positions.append(position)
+                logger.info(f"Executed {signal.type} signal for {signal.symbol} at {signal.price}")
                 
-                if signal_type == 'buy':
-                    # Calculate position size
-                    quantity = self.risk_manager.calculate_position_size(symbol, 'LONG', price)
-                    
-                    # Calculate stop loss and take profit
-                    stop_loss = signal.get('stop_loss')
-                    take_profit = signal.get('take_profit')
-                    
-                    # Open long position
-                    position = self.position_manager.open_position(
-                        symbol=symbol,
-                        side='LONG',
-                        quantity=quantity,
-                        price=price,
-                        stop_loss=stop_loss,
-                        take_profit=take_profit
-                    )
-                    
-                    executed_positions.append(position)
-                    logger.info(f"Executed buy signal for {symbol} at {price}")
-                    
-                elif signal_type == 'sell':
-                    # Calculate position size
-                    quantity = self.risk_manager.calculate_position_size(symbol, 'SHORT', price)
-                    
-                    # Calculate stop loss and take profit
-                    stop_loss = signal.get('stop_loss')
-                    take_profit = signal.get('take_profit')
-                    
-                    # Open short position
-                    position = self.position_manager.open_position(
-                        symbol=symbol,
-                        side='SHORT',
-                        quantity=quantity,
-                        price=price,
-                        stop_loss=stop_loss,
-                        take_profit=take_profit
-                    )
-                    
-                    executed_positions.append(position)
-                    logger.info(f"Executed sell signal for {symbol} at {price}")
-                    
             except Exception as e:
-                logger.error(f"Error executing signal for {signal.get('symbol')}: {e}")
+                logger.error(f"Error executing signal for {signal.symbol}: {e}")
         
         return executed_positions
     
@@ -181,21 +167,21 @@ class ExecutionModule:
         """
         return self.executor.get_account_balance()
     
-    def get_open_positions(self) -> List[Dict[str, Any]]:
+    def get_open_positions(self) -> Sequence[Mapping[str, Any]]:
         """
         Get all open positions.
         
         Returns:
-            List of open positions
+            Read-only snapshot of open positions
         """
         return self.position_manager.get_open_positions()
     
-    def get_position_history(self) -> List[Dict[str, Any]]:
+    def get_position_history(self) -> Sequence[Mapping[str, Any]]:
         """
         Get position history.
         
         Returns:
-            List of closed positions
+            Read-only snapshot of closed positions
         """
         return self.position_manager.get_position_history()
     
@@ -57,7 +57,7 @@ class BinanceExecutor(OrderExecutor):
     def place_order(self, symbol: str, side: str, order_type: str, 
                    quantity: float, price: Optional[float] = None,
                    stop_price: Optional[float] = None,
-                   time_in_force: str = 'GTC') -> Dict[str, Any]:
+                   time_in_force: str = 'GTC', reduce_only: bool = False) -> Dict[str, Any]:
         """
         Place an order on Binance.
         
@@ -69,6 +69,7 @@ class BinanceExecutor(OrderExecutor):
             price: Order price (required for limit orders)
             stop_price: Stop price (required for stop loss orders)
             time_in_force: Time in force ('GTC', 'IOC', 'FOK')
+            reduce_only: Whether the order only closes or protects an existing position
             
         Returns:
             Order information
@@ -92,7 +93,7 @@ class BinanceExecutor(OrderExecutor):
             }
         
         # Check with risk manager if this order is allowed
-        if not self.risk_manager.check_order(symbol, side, quantity, price):
+        if not self.risk_manager.check_order(symbol, side, quantity, price, reduce_only=reduce_only):
             logger.warning(f"Order rejected by risk manager: {side} {quantity} {symbol} at {price}")
             raise ValueError("Order rejected by risk manager")
         
@@ -162,6 +163,60 @@ class BinanceExecutor(OrderExecutor):
             logger.error(f"Error cancelling order on Binance: {e}")
             raise
     
+    def replace_order(self, symbol: str, order_id: str, side: str, order_type: str,
+                      quantity: float, price: Optional[float] = None,
+                      stop_price: Optional[float] = None, reduce_only: bool = False) -> Dict[str, Any]:
+        """
+        Replace an existing order on Binance with a single cancel-replace request.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_id: ID of the order to replace
+            side: Order side ('BUY' or 'SELL')
+            order_type: Order type of the new order
+            quantity: Order quantity
+            price: Order price (required for limit orders)
+            stop_price: Stop price (required for stop loss orders)
+            reduce_only: Whether the order only closes or protects an existing position
+            
+        Returns:
+            New order information
+        """
+        # Paper mode has no resting orders to replace
+        if self.trading_mode == 'paper':
+            return super().replace_order(symbol, order_id, side, order_type, quantity, price, stop_price,
+                                         reduce_only=reduce_only)
+        
+        # Check with risk manager if this order is allowed
+        if not self.risk_manager.check_order(symbol, side, quantity, price, reduce_only=reduce_only):
+            logger.warning(f"Order rejected by risk manager: {side} {quantity} {symbol} at {price}")
+            raise ValueError("Order rejected by risk manager")
+        
+        try:
+            params = {
+                'symbol': symbol,
+                'side': side,
+                'type': order_type,
+                'quantity': quantity,
+                'cancelReplaceMode': 'STOP_ON_FAILURE',
+                'cancelOrderId': order_id
+            }
+            if price is not None:
+                params['price'] = price
+                params['timeInForce'] = 'GTC'
+            if stop_price is not None:
+                params['stopPrice'] = stop_price
+            
+            result = self.client.cancel_replace_order(**params)
+            order = result['newOrderResponse']
+            
+            logger.debug(f"Replaced order {order_id} for {symbol} with {order['orderId']}")
+            return order
+            
+        except BinanceAPIException as e:
+            logger.error(f"Error replacing order on Binance: {e}")
+            raise
+    
     def get_order(self, symbol: str, order_id: str) -> Dict[str, Any]:
         """
         Get information about an order on Binance.
@@ -2,10 +2,13 @@
 Base interface for order execution.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 
 class OrderExecutor(ABC):
     """
@@ -16,7 +19,7 @@ class OrderExecutor(ABC):
     def place_order(self, symbol: str, side: str, order_type: str, 
                    quantity: float, price: Optional[float] = None,
                    stop_price: Optional[float] = None,
-                   time_in_force: str = 'GTC') -> Dict[str, Any]:
+                   time_in_force: str = 'GTC', reduce_only: bool = False) -> Dict[str, Any]:
         """
         Place an order on the exchange.
         
@@ -28,6 +31,7 @@ class OrderExecutor(ABC):
             price: Order price (required for limit orders)
             stop_price: Stop price (required for stop loss orders)
             time_in_force: Time in force ('GTC', 'IOC', 'FOK')
+            reduce_only: Whether the order only closes or protects an existing position
             
         Returns:
             Order information
@@ -102,3 +106,60 @@ class OrderExecutor(ABC):
             Order information
         """
         pass
+    
+    def cancel_orders(self, symbol: str, order_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Cancel several orders for the same symbol.
+        
+        Each order is cancelled on its own, so one that has already filled or
+        been cancelled does not keep the others open; failures are logged and
+        skipped. Executors with a batch cancel endpoint should override this to
+        issue a single request, with the same tolerance for unknown orders.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_ids: Order IDs to cancel
+            
+        Returns:
+            List of cancellation information for the orders that were cancelled
+        """
+        results = []
+        for order_id in order_ids:
+            try:
+                results.append(self.cancel_order(symbol, order_id))
+            except Exception as e:
+                logger.error("Error cancelling order %s for %s: %s", order_id, symbol, e)
+        return results
+    
+    def replace_order(self, symbol: str, order_id: str, side: str, order_type: str,
+                      quantity: float, price: Optional[float] = None,
+                      stop_price: Optional[float] = None, reduce_only: bool = False) -> Dict[str, Any]:
+        """
+        Replace an existing order with a new one.
+        
+        Executors with an atomic cancel-replace endpoint should override this
+        to issue a single request.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_id: ID of the order to replace
+            side: Order side ('BUY' or 'SELL')
+            order_type: Order type of the new order
+            quantity: Order quantity
+            price: Order price (required for limit orders)
+            stop_price: Stop price (required for stop loss orders)
+            reduce_only: Whether the order only closes or protects an existing position
+            
+        Returns:
+            New order information
+        """
+        self.cancel_order(symbol, order_id)
+        return self.place_order(
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            stop_price=stop_price,
+            reduce_only=reduce_only
+        )
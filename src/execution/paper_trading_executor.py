@@ -79,7 +79,7 @@ class PaperTradingExecutor(OrderExecutor):
     def place_order(self, symbol: str, side: str, order_type: str, 
                    quantity: float, price: Optional[float] = None,
                    stop_price: Optional[float] = None,
-                   time_in_force: str = 'GTC') -> Dict[str, Any]:
+                   time_in_force: str = 'GTC', reduce_only: bool = False) -> Dict[str, Any]:
         """
         Place a paper trading order.
         
@@ -91,12 +91,13 @@ class PaperTradingExecutor(OrderExecutor):
             price: Order price (required for limit orders)
             stop_price: Stop price (required for stop loss orders)
             time_in_force: Time in force ('GTC', 'IOC', 'FOK')
+            reduce_only: Whether the order only closes or protects an existing position
             
         Returns:
             Order information
         """
         # Check with risk manager if this order is allowed
-        if not self.risk_manager.check_order(symbol, side, quantity, price):
+        if not self.risk_manager.check_order(symbol, side, quantity, price, reduce_only=reduce_only):
             logger.warning(f"Order rejected by risk manager: {side} {quantity} {symbol} at {price}")
             raise ValueError("Order rejected by risk manager")
         
@@ -380,7 +381,8 @@ class PaperTradingExecutor(OrderExecutor):
             side=side,
             order_type='MARKET',
             quantity=quantity,
-            price=current_price
+            price=current_price,
+            reduce_only=True
         )
         
         # Calculate profit/loss
@@ -3,15 +3,116 @@ Position manager for tracking and managing trading positions.
 """
 
 import logging
+import operator
 import time
-from typing import Dict, List, Any, Optional
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Union
+import numpy as np
 import pandas as pd
 
 from src.execution.order_executor import OrderExecutor
 from src.risk_management.risk_manager import RiskManager
+from src.utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
+class Side(IntEnum):
+    """
+    Position side. The value is the sign applied to price moves in PnL calculations.
+    """
+    
+    LONG = 1
+    SHORT = -1
+    
+    def __str__(self) -> str:
+        return self.name
+
+# Order side used to open and to close (or protect) a position of each side
+_OPEN_SIDE = {Side.LONG: 'BUY', Side.SHORT: 'SELL'}
+_CLOSE_SIDE = {Side.LONG: 'SELL', Side.SHORT: 'BUY'}
+
+# Milliseconds per day, for bucketing exit times into UTC days
+_DAY_MS = 86_400_000
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _equity_stats(pnl):
+    """
+    Compute final equity and maximum drawdown of a PnL series in one pass.
+    
+    Args:
+        pnl: PnL per trade ordered by exit time
+        
+    Returns:
+        Tuple of (final equity, maximum drawdown)
+    """
+    equity = 0.0
+    peak = 0.0
+    max_drawdown = 0.0
+    for i in range(pnl.shape[0]):
+        equity += pnl[i]
+        if equity > peak:
+            peak = equity
+        drawdown = peak - equity
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+    return equity, max_drawdown
+
+class SymbolRegistry:
+    """
+    Maps trading pair symbols to small integer ids for cheap comparisons.
+    """
+    
+    __slots__ = ('_ids', '_names')
+    
+    def __init__(self):
+        """
+        Initialize an empty symbol registry.
+        """
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+    
+    def get_id(self, name: str) -> int:
+        """
+        Get the id for a symbol, registering it if needed.
+        
+        Args:
+            name: Trading pair symbol
+            
+        Returns:
+            Integer symbol id
+        """
+        sid = self._ids.get(name)
+        if sid is None:
+            sid = len(self._names)
+            self._ids[name] = sid
+            self._names.append(name)
+        return sid
+    
+    def find_id(self, name: str) -> Optional[int]:
+        """
+        Get the id for a symbol without registering it.
+        
+        Args:
+            name: Trading pair symbol
+            
+        Returns:
+            Integer symbol id, or None if the symbol was never registered
+        """
+        return self._ids.get(name)
+    
+    def get_name(self, sid: int) -> str:
+        """
+        Get the symbol registered under an id.
+        
+        Args:
+            sid: Integer symbol id
+            
+        Returns:
+            Trading pair symbol
+        """
+        return self._names[sid]
+
 class PositionManager:
     """
     Manages trading positions and their lifecycle.
@@ -34,6 +135,22 @@ class PositionManager:
         self.positions = []
         self.position_history = []
         
+        # Symbol ids used by this manager's positions
+        self.symbols = SymbolRegistry()
+        
+        # Read-side snapshot of open positions (read-only copies), republished on every change
+        self._snapshot = ()
+        
+        # Whether position_history is already ordered by exit time
+        self._history_monotonic = True
+        
+        # Realized PnL of the positions closed on the current UTC day
+        self._daily_pnl = 0.0
+        self._pnl_day = -1
+        
+        # The risk limits check against this manager's live state
+        risk_manager.bind_account_state(lambda: len(self.positions), self.get_daily_pnl)
+        
         logger.info("Position manager initialized")
     
     def import_existing_positions(self, symbols: List[str] = None) -> List[Dict[str, Any]]:
@@ -83,7 +200,7 @@ class PositionManager:
                     ticker = self.executor.client.get_symbol_ticker(symbol=symbol)
                     current_prices[symbol] = float(ticker['price'])
                 except Exception as e:
-                    logger.error(f"Error getting price for {symbol}: {e}")
+                    logger.error("Error getting price for %s: %s", symbol, e)
             
             # Import positions
             for symbol in symbols:
@@ -108,7 +225,7 @@ class PositionManager:
                     # Get current price
                     current_price = current_prices.get(symbol)
                     if not current_price:
-                        logger.warning(f"Could not get price for {symbol}, skipping import")
+                        logger.warning("Could not get price for %s, skipping import", symbol)
                         continue
                     
                     # Try to get average entry price from Binance API (only works for futures)
@@ -121,7 +238,7 @@ class PositionManager:
                             if positions and float(positions[0]['positionAmt']) != 0:
                                 entry_price = float(positions[0]['entryPrice'])
                     except Exception as e:
-                        logger.debug(f"Could not get entry price for {symbol} from futures API: {e}")
+                        logger.debug("Could not get entry price for %s from futures API: %s", symbol, e)
                     
                     # For spot trading, we don't have entry price, so we use current price
                     # and apply a reasonable stop loss based on ATR or a percentage
@@ -138,7 +255,8 @@ class PositionManager:
                         'timestamp': int(time.time() * 1000),  # required Current time as we don't know actual entry time
                         'price': current_price, # required
                         'symbol': symbol, # required
-                        'side': 'LONG',  # Assume long for spot positions
+                        'symbol_id': self.symbols.get_id(symbol),
+                        'side': Side.LONG,  # Assume long for spot positions
                         'quantity': asset_balance,
                         'entry_price': entry_price,
                         #'entry_order_id': symbol.orderId if hasattr(symbol, 'orderId') else None,
@@ -152,21 +270,22 @@ class PositionManager:
                     # Add to positions list
                     self.positions.append(position)
                     imported_positions.append(position)
+                    self._publish()
                     
-                    logger.info(f"Imported position for {symbol}: {asset_balance} at approx. {entry_price}")
+                    logger.info("Imported position for %s: %s at approx. %s", symbol, asset_balance, entry_price)
                     
                 except Exception as e:
-                    logger.error(f"Error importing position for {symbol}: {e}")
+                    logger.error("Error importing position for %s: %s", symbol, e)
             
-            logger.info(f"Imported {len(imported_positions)} existing positions")
-            logger.info(f"Existing positions {imported_positions}")
+            logger.info("Imported %s existing positions", len(imported_positions))
+            logger.info("Existing positions %s", imported_positions)
             return imported_positions
             
         except Exception as e:
-            logger.error(f"Error importing existing positions: {e}")
+            logger.error("Error importing existing positions: %s", e)
             return []
         
-    def open_position(self, symbol: str, side: str, quantity: float, 
+    def open_position(self, symbol: str, side: Union[str, Side], quantity: float, 
                      price: Optional[float] = None, stop_loss: Optional[float] = None,
                      take_profit: Optional[float] = None) -> Dict[str, Any]:
         """
@@ -174,7 +293,7 @@ class PositionManager:
         
         Args:
             symbol: Trading pair symbol
-            side: Position side ('LONG' or 'SHORT')
+            side: Position side (Side or its name, 'LONG' or 'SHORT')
             quantity: Position size
             price: Entry price (optional, uses market price if not provided)
             stop_loss: Stop loss price (optional)
@@ -183,13 +302,15 @@ class PositionManager:
         Returns:
             Position information
         """
+        side = Side[side] if isinstance(side, str) else Side(side)
+        
         # Convert position side to order side
-        order_side = 'BUY' if side == 'LONG' else 'SELL'
+        order_side = _OPEN_SIDE[side]
         
         # Check with risk manager
-        position_size = self.risk_manager.calculate_position_size(symbol, side, price)
+        position_size = self.risk_manager.calculate_position_size(symbol, side.name, price)
         if quantity > position_size:
-            logger.warning(f"Position size {quantity} exceeds risk limit {position_size}")
+            logger.warning("Position size %s exceeds risk limit %s", quantity, position_size)
             quantity = position_size
         
         # Place the order
@@ -205,7 +326,9 @@ class PositionManager:
         position = {
             'id': f"pos_{int(time.time() * 1000)}",
             'symbol': symbol,
+            'symbol_id': self.symbols.get_id(symbol),
             'side': side,
+            'type': 'buy' if side == Side.LONG else 'sell',
             'quantity': quantity,
             'price': price or float(order.get('price', 0)),
             'timestamp': int(time.time() * 1000),
@@ -221,38 +344,41 @@ class PositionManager:
         
         # Place stop loss order if provided
         if stop_loss:
-            sl_side = 'SELL' if side == 'LONG' else 'BUY'
+            sl_side = _CLOSE_SIDE[side]
             try:
                 sl_order = self.executor.place_order(
                     symbol=symbol,
                     side=sl_side,
                     order_type='STOP_LOSS',
                     quantity=quantity,
-                    stop_price=stop_loss
+                    stop_price=stop_loss,
+                    reduce_only=True
                 )
                 position['stop_loss_order_id'] = sl_order.get('orderId')
             except Exception as e:
-                logger.error(f"Error placing stop loss order: {e}")
+                logger.error("Error placing stop loss order: %s", e)
         
         # Place take profit order if provided
         if take_profit:
-            tp_side = 'SELL' if side == 'LONG' else 'BUY'
+            tp_side = _CLOSE_SIDE[side]
             try:
                 tp_order = self.executor.place_order(
                     symbol=symbol,
                     side=tp_side,
                     order_type='TAKE_PROFIT',
                     quantity=quantity,
-                    stop_price=take_profit
+                    stop_price=take_profit,
+                    reduce_only=True
                 )
                 position['take_profit_order_id'] = tp_order.get('orderId')
             except Exception as e:
-                logger.error(f"Error placing take profit order: {e}")
+                logger.error("Error placing take profit order: %s", e)
         
         # Add to positions
         self.positions.append(position)
+        self._publish()
         
-        logger.info(f"Opened {side} position for {quantity} {symbol} at {position['entry_price']}")
+        logger.info("Opened %s position for %s %s at %s", side, quantity, symbol, position['entry_price'])
         return position
     
     def close_position(self, position_id: str, price: Optional[float] = None) -> Dict[str, Any]:
@@ -277,11 +403,11 @@ class PositionManager:
                 break
         
         if not position:
-            logger.warning(f"Position {position_id} not found")
+            logger.warning("Position %s not found", position_id)
             raise ValueError(f"Position {position_id} not found")
         
         # Convert position side to order side (opposite for closing)
-        order_side = 'SELL' if position['side'] == 'LONG' else 'BUY'
+        order_side = _CLOSE_SIDE[position['side']]
         
         # Place the order
         order = self.executor.place_order(
@@ -289,21 +415,18 @@ class PositionManager:
             side=order_side,
             order_type='MARKET',
             quantity=position['quantity'],
-            price=price
+            price=price,
+            reduce_only=True
         )
         
         # Cancel any existing stop loss or take profit orders
-        if 'stop_loss_order_id' in position:
-            try:
-                self.executor.cancel_order(position['symbol'], position['stop_loss_order_id'])
-            except Exception as e:
-                logger.error(f"Error cancelling stop loss order: {e}")
-        
-        if 'take_profit_order_id' in position:
+        cancel_ids = [position[key] for key in ('stop_loss_order_id', 'take_profit_order_id')
+                      if position.get(key)]
+        if cancel_ids:
             try:
-                self.executor.cancel_order(position['symbol'], position['take_profit_order_id'])
+                self.executor.cancel_orders(position['symbol'], cancel_ids)
             except Exception as e:
-                logger.error(f"Error cancelling take profit order: {e}")
+                logger.error("Error cancelling stop loss/take profit orders: %s", e)
         
         # Update position
         exit_price = price or float(order.get('price', 0))
@@ -316,20 +439,26 @@ class PositionManager:
         entry_price = position['entry_price']
         quantity = position['quantity']
         
-        if position['side'] == 'LONG':
-            pnl = (exit_price - entry_price) * quantity
-        else:
-            pnl = (entry_price - exit_price) * quantity
+        pnl = (exit_price - entry_price) * quantity * position['side']
         
         position['pnl'] = pnl
         position['pnl_percent'] = (pnl / (entry_price * quantity)) * 100
         
         # Move to position history
+        if self.position_history and position['exit_time'] < self.position_history[-1]['exit_time']:
+            self._history_monotonic = False
         self.position_history.append(position)
         self.positions.pop(position_index)
         
-        logger.info(f"Closed {position['side']} position for {quantity} {position['symbol']} " +
-                   f"at {exit_price} with PnL: {pnl:.2f} ({position['pnl_percent']:.2f}%)")
+        day = position['exit_time'] // _DAY_MS
+        if day != self._pnl_day:
+            self._pnl_day = day
+            self._daily_pnl = 0.0
+        self._daily_pnl += pnl
+        self._publish()
+        
+        logger.info("Closed %s position for %s %s at %s with PnL: %.2f (%.2f%%)",
+                    position['side'], quantity, position['symbol'], exit_price, pnl, position['pnl_percent'])
         return position
     
     def update_position(self, position_id: str, current_price: float) -> Dict[str, Any]:
@@ -345,14 +474,16 @@ class PositionManager:
         """
         # Find the position
         position = None
+        position_index = -1
         
-        for pos in self.positions:
+        for i, pos in enumerate(self.positions):
             if pos['id'] == position_id:
                 position = pos
+                position_index = i
                 break
         
         if not position:
-            logger.warning(f"Position {position_id} not found")
+            logger.warning("Position %s not found", position_id)
             raise ValueError(f"Position {position_id} not found")
         
         # Update current price
@@ -362,16 +493,15 @@ class PositionManager:
         entry_price = position['entry_price']
         quantity = position['quantity']
         
-        if position['side'] == 'LONG':
-            pnl = (current_price - entry_price) * quantity
-        else:
-            pnl = (entry_price - current_price) * quantity
+        pnl = (current_price - entry_price) * quantity * position['side']
         
         position['unrealized_pnl'] = pnl
         position['unrealized_pnl_percent'] = (pnl / (entry_price * quantity)) * 100
         
-        logger.debug(f"Updated {position['side']} position for {quantity} {position['symbol']} " +
-                    f"at {current_price} with unrealized PnL: {pnl:.2f} ({position['unrealized_pnl_percent']:.2f}%)")
+        self._publish_one(position_index)
+        
+        logger.debug("Updated %s position for %s %s at %s with unrealized PnL: %.2f (%.2f%%)",
+                     position['side'], quantity, position['symbol'], current_price, pnl, position['unrealized_pnl_percent'])
         return position
     
     def update_trailing_stop(self, position_id: str, current_price: float) -> Dict[str, Any]:
@@ -387,19 +517,21 @@ class PositionManager:
         """
         # Find the position
         position = None
+        position_index = -1
         
-        for pos in self.positions:
+        for i, pos in enumerate(self.positions):
             if pos['id'] == position_id:
                 position = pos
+                position_index = i
                 break
         
         if not position:
-            logger.warning(f"Position {position_id} not found")
+            logger.warning("Position %s not found", position_id)
             raise ValueError(f"Position {position_id} not found")
         
         # Check if trailing stop is enabled
         if not position.get('trailing_stop_enabled', False):
-            logger.debug(f"Trailing stop not enabled for position {position_id}")
+            logger.debug("Trailing stop not enabled for position %s", position_id)
             return position
         
         # Get trailing stop parameters
@@ -407,7 +539,7 @@ class PositionManager:
         callback_rate = position.get('trailing_stop_callback_rate', 1.0)  # Default 1%
         
         # Check if trailing stop is activated
-        if position['side'] == 'LONG':
+        if position['side'] == Side.LONG:
             # For long positions, trailing stop activates when price rises above activation price
             if current_price > activation_price:
                 # Calculate new stop loss price
@@ -420,22 +552,21 @@ class PositionManager:
                     # Update stop loss order if it exists
                     if 'stop_loss_order_id' in position:
                         try:
-                            # Cancel existing order
-                            self.executor.cancel_order(position['symbol'], position['stop_loss_order_id'])
-                            
-                            # Place new order
-                            sl_order = self.executor.place_order(
+                            # Replace existing order
+                            sl_order = self.executor.replace_order(
                                 symbol=position['symbol'],
-                                side='SELL',
+                                order_id=position['stop_loss_order_id'],
+                                side=_CLOSE_SIDE[position['side']],
                                 order_type='STOP_LOSS',
                                 quantity=position['quantity'],
-                                stop_price=new_stop_loss
+                                stop_price=new_stop_loss,
+                                reduce_only=True
                             )
                             position['stop_loss_order_id'] = sl_order.get('orderId')
                             
-                            logger.info(f"Updated trailing stop for {position['symbol']} to {new_stop_loss}")
+                            logger.info("Updated trailing stop for %s to %s", position['symbol'], new_stop_loss)
                         except Exception as e:
-                            logger.error(f"Error updating trailing stop: {e}")
+                            logger.error("Error updating trailing stop: %s", e)
         else:
             # For short positions, trailing stop activates when price falls below activation price
             if current_price < activation_price:
@@ -449,22 +580,23 @@ class PositionManager:
                     # Update stop loss order if it exists
                     if 'stop_loss_order_id' in position:
                         try:
-                            # Cancel existing order
-                            self.executor.cancel_order(position['symbol'], position['stop_loss_order_id'])
-                            
-                            # Place new order
-                            sl_order = self.executor.place_order(
+                            # Replace existing order
+                            sl_order = self.executor.replace_order(
                                 symbol=position['symbol'],
-                                side='BUY',
+                                order_id=position['stop_loss_order_id'],
+                                side=_CLOSE_SIDE[position['side']],
                                 order_type='STOP_LOSS',
                                 quantity=position['quantity'],
-                                stop_price=new_stop_loss
+                                stop_price=new_stop_loss,
+                                reduce_only=True
                             )
                             position['stop_loss_order_id'] = sl_order.get('orderId')
                             
-                            logger.info(f"Updated trailing stop for {position['symbol']} to {new_stop_loss}")
+                            logger.info("Updated trailing stop for %s to %s", position['symbol'], new_stop_loss)
                         except Exception as e:
-                            logger.error(f"Error updating trailing stop: {e}")
+                            logger.error("Error updating trailing stop: %s", e)
+                    
+                    self._publish_one(position_index)
         
         return position
     
@@ -483,25 +615,47 @@ class PositionManager:
         """
         # Find the position
         position = None
+        position_index = -1
         
-        for pos in self.positions:
+        for i, pos in enumerate(self.positions):
             if pos['id'] == position_id:
                 position = pos
+                position_index = i
                 break
         
         if not position:
-            logger.warning(f"Position {position_id} not found")
+            logger.warning("Position %s not found", position_id)
             raise ValueError(f"Position {position_id} not found")
         
         # Enable trailing stop
         position['trailing_stop_enabled'] = True
         position['trailing_stop_activation_price'] = activation_price
         position['trailing_stop_callback_rate'] = callback_rate
+        self._publish_one(position_index)
         
-        logger.info(f"Enabled trailing stop for {position['symbol']} with activation price {activation_price} " +
-                   f"and callback rate {callback_rate}%")
+        logger.info("Enabled trailing stop for %s with activation price %s and callback rate %s%%",
+                    position['symbol'], activation_price, callback_rate)
         return position
     
+    def _publish(self) -> None:
+        """
+        Publish a new read-only snapshot of the open positions.
+        
+        Readers get read-only copies, so later changes to the live positions
+        only become visible through the next snapshot.
+        """
+        self._snapshot = tuple(MappingProxyType(dict(pos)) for pos in self.positions)
+    
+    def _publish_one(self, index: int) -> None:
+        """
+        Publish a new snapshot in which only the position at index is recopied.
+        
+        Args:
+            index: Index of the changed position in self.positions
+        """
+        snapshot = self._snapshot
+        self._snapshot = snapshot[:index] + (MappingProxyType(dict(self.positions[index])),) + snapshot[index + 1:]
+    
     def get_position(self, position_id: str) -> Dict[str, Any]:
         """
         Get information about a position.
@@ -522,10 +676,10 @@ class PositionManager:
             if pos['id'] == position_id:
                 return pos
         
-        logger.warning(f"Position {position_id} not found")
+        logger.warning("Position %s not found", position_id)
         raise ValueError(f"Position {position_id} not found")
     
-    def get_open_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_open_positions(self, symbol: Optional[str] = None) -> Sequence[Mapping[str, Any]]:
         """
         Get all open positions.
         
@@ -533,27 +687,26 @@ class PositionManager:
             symbol: Trading pair symbol (optional)
             
         Returns:
-            List of open positions
+            Read-only snapshot (tuple) of open positions
         """
+        snapshot = self._snapshot
         if symbol:
-            open_positions = [pos for pos in self.positions if pos['symbol'] == symbol]
+            # Looking a symbol up must not register it
+            sid = self.symbols.find_id(symbol)
+            open_positions = tuple(pos for pos in snapshot if pos['symbol_id'] == sid) if sid is not None else ()
         else:
-            open_positions = self.positions.copy()
+            open_positions = snapshot
             if open_positions:
-                logger.info(f"Retrieved {len(open_positions)} open positions")
-        
-                for pos in open_positions:
-                    # Update type to 'buy' or 'sell'
-                    pos['type'] = 'buy' if pos['side'] == 'LONG' else 'sell'
+                logger.info("Retrieved %s open positions", len(open_positions))
                         
                 for pos in open_positions:
                     logger.debug("Position object:")        
                     for key, value in pos.items():
-                        logger.debug(f"{key}: {value}")
+                        logger.debug("%s: %s", key, value)
             
         return open_positions
     
-    def get_position_history(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_position_history(self, symbol: Optional[str] = None) -> Sequence[Mapping[str, Any]]:
         """
         Get position history.
         
@@ -561,17 +714,31 @@ class PositionManager:
             symbol: Trading pair symbol (optional)
             
         Returns:
-            List of closed positions
+            Read-only snapshot (tuple) of closed positions
         """
         if symbol:
-            history = [pos for pos in self.position_history if pos['symbol'] == symbol]
+            sid = self.symbols.find_id(symbol)
+            history = tuple(MappingProxyType(pos) for pos in self.position_history
+                            if pos['symbol_id'] == sid) if sid is not None else ()
         else:
-            history = self.position_history.copy()
+            # Closed positions no longer change, so read-only views need no copy
+            history = tuple(MappingProxyType(pos) for pos in self.position_history)
         
-        logger.info(f"Retrieved {len(history)} closed positions")
+        logger.info("Retrieved %s closed positions", len(history))
         
         return history
     
+    def get_daily_pnl(self) -> float:
+        """
+        Get the realized PnL of the positions closed on the current UTC day.
+        
+        Returns:
+            Realized PnL of the current day
+        """
+        if self._pnl_day != int(time.time() * 1000) // _DAY_MS:
+            return 0.0
+        return self._daily_pnl
+    
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
         Calculate performance metrics for all closed positions.
@@ -594,44 +761,41 @@ class PositionManager:
                 'max_drawdown': 0.0
             }
         
-        # Calculate metrics
-        total_trades = len(self.position_history)
-        winning_trades = sum(1 for pos in self.position_history if pos['pnl'] > 0)
-        losing_trades = sum(1 for pos in self.position_history if pos['pnl'] < 0)
+        # Calculate metrics in a single pass over the history
+        total_trades = winning_trades = losing_trades = 0
+        gross_profit = 0.0
+        losing_sum = 0.0
+        
+        for pos in self.position_history:
+            pnl = pos['pnl']
+            total_trades += 1
+            if pnl > 0:
+                winning_trades += 1
+                gross_profit += pnl
+            elif pnl < 0:
+                losing_trades += 1
+                losing_sum += pnl
         
         win_rate = winning_trades / total_trades if total_trades > 0 else 0.0
         
-        total_pnl = sum(pos['pnl'] for pos in self.position_history)
+        total_pnl = gross_profit + losing_sum
         average_pnl = total_pnl / total_trades if total_trades > 0 else 0.0
         
-        winning_pnls = [pos['pnl'] for pos in self.position_history if pos['pnl'] > 0]
-        losing_pnls = [pos['pnl'] for pos in self.position_history if pos['pnl'] < 0]
+        average_win = gross_profit / winning_trades if winning_trades else 0.0
+        average_loss = losing_sum / losing_trades if losing_trades else 0.0
         
-        average_win = sum(winning_pnls) / len(winning_pnls) if winning_pnls else 0.0
-        average_loss = sum(losing_pnls) / len(losing_pnls) if losing_pnls else 0.0
-        
-        gross_profit = sum(winning_pnls)
-        gross_loss = abs(sum(losing_pnls))
+        gross_loss = abs(losing_sum)
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
         
         # Calculate maximum drawdown
-        equity_curve = []
-        current_equity = 0
-        
-        for pos in sorted(self.position_history, key=lambda x: x['exit_time']):
-            current_equity += pos['pnl']
-            equity_curve.append(current_equity)
-        
-        if not equity_curve:
-            max_drawdown = 0.0
+        if self._history_monotonic:
+            ordered = self.position_history
         else:
-            max_equity = 0
-            max_drawdown = 0
-            
-            for equity in equity_curve:
-                max_equity = max(max_equity, equity)
-                drawdown = max_equity - equity
-                max_drawdown = max(max_drawdown, drawdown)
+            ordered = sorted(self.position_history, key=operator.itemgetter('exit_time'))
+        
+        pnls = np.fromiter((pos['pnl'] for pos in ordered), dtype=np.float64, count=len(ordered))
+        _, max_drawdown = _equity_stats(pnls)
+        max_drawdown = float(max_drawdown)
         
         metrics = {
             'total_trades': total_trades,
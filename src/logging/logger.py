@@ -9,21 +9,25 @@ import sys
 from pathlib import Path
 
 
+# ANSI color prefix per log level, keyed by levelno to avoid hashing the level name
+# on every record. Colors are disabled when stdout is not a terminal.
+_USE_COLOR = sys.stdout.isatty()
+_LEVEL_PREFIX = {
+    logging.DEBUG: "\033[94m",     # Blue
+    logging.INFO: "\033[92m",      # Green
+    logging.WARNING: "\033[93m",   # Yellow
+    logging.ERROR: "\033[91m",     # Red
+    logging.CRITICAL: "\033[91m",  # Red
+} if _USE_COLOR else {}
+_RESET = "\033[0m" if _USE_COLOR else ""  # Reset to default
+
+
 class ColorFormatter(logging.Formatter):
-    # Define ANSI escape codes for colors
-    COLORS = {
-        "INFO": "\033[92m",   # Green
-        "ERROR": "\033[91m",  # Red
-        "WARNING": "\033[93m", # Yellow
-        "DEBUG": "\033[94m",  # Blue
-        "RESET": "\033[0m"    # Reset to default
-    }
 
     def format(self, record):
         # Apply color based on the log level
-        color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-        message = super().format(record)
-        return f"{color}{message}{self.COLORS['RESET']}"
+        prefix = _LEVEL_PREFIX.get(record.levelno, "")
+        return f"{prefix}{super().format(record)}{_RESET}"
 
 def setup_logger(log_level=logging.DEBUG, log_to_file=False):
     """
@@ -4,13 +4,15 @@ import os
 import sys
 from pathlib import Path
 
-# Add the project root directory to sys.path
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add the project root directory to sys.path (once, so repeated imports don't grow it)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
 import logging
-import time
 import argparse
 import signal
+import threading
 import pandas as pd
 
 from src.config.config_manager import ConfigManager
@@ -61,7 +63,11 @@ class TradingBot:
         self.trading_interval = self.config.get('bot', 'trading_interval', default=3600)  # Default: 1 hour
         trading_pairs = self.config.get('bot', 'trading_pairs', default=None)
         self.top_n_cryptos = self.config.get('bot', 'top_n_cryptos', default=10)
+        self.configured_pairs = self.config.get('bot', 'trading_pairs', default=['BTCUSDT'])
+        self.candle_interval = self.config.get('bot', 'candle_interval', default='1h')
+        self.historical_days = self.config.get('bot', 'historical_data_days', default='7')
         self.running = False
+        self._stop_event = threading.Event()
         
         self.logger.info("Trading bot initialized")
     
@@ -71,6 +77,7 @@ class TradingBot:
         """
         self.logger.info("Starting trading bot...")
         self.running = True
+        self._stop_event.clear()
         
         # Register signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -86,7 +93,7 @@ class TradingBot:
                     
                     # if trading_pais from config.yaml is None, get top trading pairs from data_collection
                     # else, use trading_pairs from config.yaml
-                    trading_pairs = self.config.get('bot', 'trading_pairs', default=['BTCUSDT'])
+                    trading_pairs = self.configured_pairs
                     if trading_pairs is None:
                         # Get top trading pairs from data collection
                         self.logger.info("Step 1: Fetching top trading pairs...")
@@ -94,10 +101,10 @@ class TradingBot:
 
                     self.logger.info(f"Top {len(trading_pairs)} trading pairs: {trading_pairs}")
                     
-                    candle_interval = self.config.get('bot', 'candle_interval', default='1h')
+                    candle_interval = self.candle_interval
                     self.logger.info(f"Candle interval: {candle_interval}")
 
-                    days = self.config.get('bot', 'historical_data_days', default='7') 
+                    days = self.historical_days
                     self.logger.info(f"Historical Data:  {days} days")
 
                     # Step 2: Get historical data for pairs
@@ -122,10 +129,7 @@ class TradingBot:
                         self.logger.info(f"Step 5: Executed {len(executed_positions)} positions")
                     
                     # Step 6: Update positions with current prices
-                    current_prices = {}
-                    for pair in trading_pairs:
-                        if pair in historical_data:
-                            current_prices[pair] = historical_data[pair].iloc[-1]['Close']
+                    current_prices = {pair: df['Close'].to_numpy()[-1] for pair, df in historical_data.items()}
                     
                     self.execution.update_positions(current_prices)
                     self.logger.info("Step 6: Updated positions with current prices")
@@ -145,8 +149,9 @@ class TradingBot:
                     self.logger.info(f"Step 9: Performance metrics ")
                     
                     # Log performance metrics
-                    for key, value in metrics.items():
-                        self.logger.info(f"{key}: {value}")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        for key, value in metrics.items():
+                            self.logger.info("%s: %s", key, value)
             
                 except Exception as e:
                     self.logger.error(f"Error in trading cycle: {e}")
@@ -155,16 +160,15 @@ class TradingBot:
                 self.logger.info(f"Step 10: Trading cycle completed. Waiting {self.trading_interval} seconds for next cycle...")
                 self.logger.info(f"------")
                
-                # time.sleep(self.trading_interval)
-                for _ in range(self.trading_interval):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Sleep until the next cycle, waking early if stopped
+                if self._stop_event.wait(self.trading_interval):
+                    break
         
         except Exception as e:
             self.logger.error(f"Critical error in trading bot: {e}")
         
         finally:
+            self.strategy.shutdown()
             self.logger.info("Trading bot stopped")
             self.logger.warning("Shutdown")
     
@@ -174,6 +178,7 @@ class TradingBot:
         """
         self.logger.info("Stopping trading bot...")
         self.running = False
+        self._stop_event.set()
     
     def _signal_handler(self, sig, frame):
         """
@@ -3,16 +3,24 @@ Risk management module for the trading bot.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Relative slack on the position size limit, so orders sized exactly to it survive float rounding
+_SIZE_TOLERANCE = 1e-9
+
 class RiskManager:
     """
     Manages risk for trading operations.
     """
     
+    # Risk parameters are read on every order check, so keep them in fixed slots
+    __slots__ = ('config', 'max_position_size', 'max_open_positions', 'max_daily_loss',
+                 'trailing_stop_pct', 'account_balance', '_open_positions_source', '_daily_pnl_source')
+    
     def __init__(self, config):
         """
         Initialize the risk manager.
@@ -28,11 +36,43 @@ class RiskManager:
         self.max_daily_loss = config.get('risk', 'max_daily_loss', default=0.03)  # 3% of account
         self.trailing_stop_pct = config.get('risk', 'trailing_stop_pct', default=0.02)  # 2%
         
+        # Account balance, resolved once instead of on every order
+        self.account_balance = config.get('paper_trading', 'initial_balance', default=10000.0)
+        
+        # Live account state, supplied by the position manager through bind_account_state
+        self._open_positions_source: Callable[[], int] = lambda: 0
+        self._daily_pnl_source: Callable[[], float] = lambda: 0.0
+        
         logger.info("Risk manager initialized with parameters:")
-        logger.info(f"Max position size: {self.max_position_size * 100}% of account")
-        logger.info(f"Max open positions: {self.max_open_positions}")
-        logger.info(f"Max daily loss: {self.max_daily_loss * 100}% of account")
-        logger.info(f"Trailing stop percentage: {self.trailing_stop_pct * 100}%")
+        logger.info("Max position size: %s%% of account", self.max_position_size * 100)
+        logger.info("Max open positions: %s", self.max_open_positions)
+        logger.info("Max daily loss: %s%% of account", self.max_daily_loss * 100)
+        logger.info("Trailing stop percentage: %s%%", self.trailing_stop_pct * 100)
+    
+    def bind_account_state(self, open_positions: Callable[[], int], daily_pnl: Callable[[], float]) -> None:
+        """
+        Read the open position count and daily PnL from live state.
+        
+        Args:
+            open_positions: Callable returning the number of currently open positions
+            daily_pnl: Callable returning the realized PnL of the current day
+        """
+        self._open_positions_source = open_positions
+        self._daily_pnl_source = daily_pnl
+    
+    @property
+    def open_positions(self) -> int:
+        """
+        Number of currently open positions.
+        """
+        return self._open_positions_source()
+    
+    @property
+    def daily_pnl(self) -> float:
+        """
+        Realized PnL of the current day.
+        """
+        return self._daily_pnl_source()
     
     def calculate_position_size(self, symbol: str, side: str, price: Optional[float] = None) -> float:
         """
@@ -46,11 +86,8 @@ class RiskManager:
         Returns:
             Position size
         """
-        # Get account balance
-        account_balance = self.config.get('paper_trading', 'initial_balance', default=10000.0)
-        
         # Calculate position size based on max_position_size
-        position_size = account_balance * self.max_position_size
+        position_size = self.account_balance * self.max_position_size
         
         # Convert to quantity based on price
         if price:
@@ -59,10 +96,11 @@ class RiskManager:
             # If price is not provided, use a placeholder
             quantity = position_size / 100.0
         
-        logger.info(f"Calculated position size for {symbol}: {quantity}")
+        logger.info("Calculated position size for %s: %s", symbol, quantity)
         return quantity
     
-    def check_order(self, symbol: str, side: str, quantity: float, price: Optional[float] = None) -> bool:
+    def check_order(self, symbol: str, side: str, quantity: float, price: Optional[float] = None,
+                    reduce_only: bool = False) -> bool:
         """
         Check if an order is allowed based on risk parameters.
         
@@ -71,23 +109,26 @@ class RiskManager:
             side: Order side ('BUY' or 'SELL')
             quantity: Order quantity
             price: Order price (optional)
+            reduce_only: Whether the order only closes or protects an existing position
             
         Returns:
             Whether the order is allowed
         """
+        # Exits and protective orders reduce risk, so the limits never block them
+        if reduce_only:
+            logger.info("Order approved (reduce only): %s %s %s", side, quantity, symbol)
+            return True
+        
         # Check if we have too many open positions
-        open_positions = self.config.get('execution', 'open_positions', default=0)
-        if open_positions >= self.max_open_positions:
-            logger.warning(f"Order rejected: Max open positions ({self.max_open_positions}) reached")
+        if self.open_positions >= self.max_open_positions:
+            logger.warning("Order rejected: Max open positions (%s) reached", self.max_open_positions)
             return False
         
         # Check if we've hit the daily loss limit
-        daily_pnl = self.config.get('execution', 'daily_pnl', default=0.0)
-        account_balance = self.config.get('paper_trading', 'initial_balance', default=10000.0)
-        max_loss_amount = account_balance * self.max_daily_loss
+        max_loss_amount = self.account_balance * self.max_daily_loss
         
-        if daily_pnl < -max_loss_amount:
-            logger.warning(f"Order rejected: Daily loss limit ({self.max_daily_loss * 100}% of account) reached")
+        if self.daily_pnl < -max_loss_amount:
+            logger.warning("Order rejected: Daily loss limit (%s%% of account) reached", self.max_daily_loss * 100)
             return False
         
         # Calculate order value
@@ -95,14 +136,51 @@ class RiskManager:
             order_value = quantity * price
             
             # Check if order size exceeds max position size
-            max_position_value = account_balance * self.max_position_size
-            if order_value > max_position_value:
-                logger.warning(f"Order rejected: Position size ({order_value}) exceeds max ({max_position_value})")
+            max_position_value = self.account_balance * self.max_position_size
+            if order_value > max_position_value * (1 + _SIZE_TOLERANCE):
+                logger.warning("Order rejected: Position size (%s) exceeds max (%s)", order_value, max_position_value)
                 return False
         
-        logger.info(f"Order approved: {side} {quantity} {symbol}")
+        logger.info("Order approved: %s %s %s", side, quantity, symbol)
         return True
     
+    def check_orders_batch(self, quantities: np.ndarray, prices: np.ndarray,
+                           open_positions: Optional[int] = None) -> np.ndarray:
+        """
+        Check several new-position orders against the risk parameters at once.
+        
+        Orders are taken in sequence; each order that passes the size and loss
+        checks uses up one open position slot, so rejected orders leave their
+        slot to later ones.
+        
+        Args:
+            quantities: Order quantity per order
+            prices: Order price per order (NaN or None skips the size check)
+            open_positions: Number of currently open positions (defaults to the live count)
+            
+        Returns:
+            Boolean mask of the orders that are allowed
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if open_positions is None:
+            open_positions = self.open_positions
+        
+        # Daily loss limit applies to every order alike
+        loss_ok = self.daily_pnl >= -self.account_balance * self.max_daily_loss
+        
+        # Orders without a price can't be sized, so only priced orders are checked
+        max_position_value = self.account_balance * self.max_position_size
+        size_ok = ~(quantities * prices > max_position_value * (1 + _SIZE_TOLERANCE))
+        
+        # Remaining position slots go to the first orders that pass the other checks
+        ok = size_ok & loss_ok
+        slots_ok = np.cumsum(ok) <= self.max_open_positions - open_positions
+        
+        approved = ok & slots_ok
+        logger.info("Approved %s of %s orders", np.count_nonzero(approved), len(approved))
+        return approved
+    
     def calculate_stop_loss(self, entry_price: float, side: str) -> float:
         """
         Calculate stop loss price based on risk parameters.
@@ -119,7 +197,7 @@ class RiskManager:
         else:
             stop_loss = entry_price * (1 + self.trailing_stop_pct)
         
-        logger.info(f"Calculated stop loss for {side} position at {entry_price}: {stop_loss}")
+        logger.info("Calculated stop loss for %s position at %s: %s", side, entry_price, stop_loss)
         return stop_loss
     
     def update_trailing_stop(self, entry_price: float, current_price: float, 
@@ -142,7 +220,7 @@ class RiskManager:
             
             # Only update if new stop is higher than current stop
             if new_stop > current_stop:
-                logger.info(f"Updated trailing stop for LONG position: {current_stop} -> {new_stop}")
+                logger.info("Updated trailing stop for LONG position: %s -> %s", current_stop, new_stop)
                 return new_stop
             
         else:
@@ -151,7 +229,7 @@ class RiskManager:
             
             # Only update if new stop is lower than current stop
             if new_stop < current_stop:
-                logger.info(f"Updated trailing stop for SHORT position: {current_stop} -> {new_stop}")
+                logger.info("Updated trailing stop for SHORT position: %s -> %s", current_stop, new_stop)
                 return new_stop
         
         return current_stop
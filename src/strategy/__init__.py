@@ -3,15 +3,35 @@ Module for initializing and managing the strategy components.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, NamedTuple, Optional
+import numpy as np
 import pandas as pd
 
 from src.strategy.indicator_calculator import IndicatorCalculator
 from src.strategy.custom_strategy import CustomStrategy
+from src.strategy import kernels
 from src.strategy.signal_generator import SignalGenerator
 
 logger = logging.getLogger(__name__)
 
+class Opportunity(NamedTuple):
+    """
+    Trading opportunity found on the latest candle of a symbol.
+    """
+    symbol: str
+    timestamp: pd.Timestamp
+    price: float
+    type: str
+    signal_strength: float
+    rsi: Optional[float]
+    macd: Optional[float]
+    macd_signal: Optional[float]
+    bb_width: Optional[float]
+    stop_loss: float
+    take_profit: float
+
 class StrategyModule:
     """
     Manages the strategy components for the trading bot.
@@ -28,6 +48,19 @@ class StrategyModule:
         self.indicator_calculator = IndicatorCalculator()
         self.custom_strategy = CustomStrategy(config)
         self.signal_generator = SignalGenerator(config)
+        
+        # Columns read from the latest candle when looking for trading opportunities
+        self._latest_columns = ('Close', 'Buy_Signal', 'Sell_Signal', 'Signal_Strength',
+                                'RSI_14', 'MACD', 'MACD_Signal', 'BB_Width',
+                                f'ATR_{self.custom_strategy.atr_period}')
+        
+        # Worker processes for indicator calculation, created on first use and kept across cycles
+        self.max_analysis_workers = config.get('strategy', 'max_analysis_workers', default=1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Compile the indicator kernels now rather than during the first analysis cycle
+        kernels.warmup(self.custom_strategy.indicator_dtype)
+        
         logger.info("Strategy module initialized")
     
     def analyze_data(self, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
@@ -40,29 +73,69 @@ class StrategyModule:
         Returns:
             Dictionary mapping symbols to DataFrames with added indicators and signals
         """
-        results = {}
+        # Indicators depend on each symbol's own history, so they are computed per symbol
+        indicator_frames = {}
+        
+        # Symbols are independent, so spread them over worker processes when configured
+        futures = {}
+        if self.max_analysis_workers > 1 and len(data) > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_analysis_workers)
+            futures = {symbol: self._pool.submit(self.custom_strategy.calculate_indicators, df)
+                       for symbol, df in data.items()}
         
         for symbol, df in data.items():
             try:
-                # Calculate indicators
-                df_with_indicators = self.custom_strategy.calculate_indicators(df)
-                
-                # Generate signals
-                df_with_signals = self.custom_strategy.generate_signals(df_with_indicators)
-                
-                # Store results
-                results[symbol] = df_with_signals
-                
-                logger.info(f"Analyzed data for {symbol}: {len(df)} candles, " +
-                           f"{df_with_signals['Buy_Signal'].sum()} buy signals, " +
-                           f"{df_with_signals['Sell_Signal'].sum()} sell signals")
+                if futures:
+                    df_with_indicators = futures[symbol].result()
+                else:
+                    df_with_indicators = self.custom_strategy.calculate_indicators(df)
                 
+                # calculate_indicators returns a new frame, so it can be tagged in place
+                df_with_indicators['symbol'] = symbol
+                indicator_frames[symbol] = df_with_indicators
             except Exception as e:
-                logger.error(f"Error analyzing data for {symbol}: {e}")
+                logger.error("Error analyzing data for %s: %s", symbol, e)
+        
+        if not indicator_frames:
+            return {}
+        
+        # Signals are row-wise, so generate them once over all symbols
+        try:
+            frames = [indicator_frames[symbol] for symbol in data if symbol in indicator_frames]
+            combined = self.custom_strategy.generate_signals(pd.concat(frames), copy=False)
+            results = {symbol: df for symbol, df in combined.groupby('symbol', sort=False)}
+        except Exception as e:
+            # Fall back to one symbol at a time so a bad frame only drops its own symbol
+            logger.warning("Batched signal generation failed (%s), generating signals per symbol", e)
+            results = {}
+            for symbol in data:
+                if symbol not in indicator_frames:
+                    continue
+                try:
+                    results[symbol] = self.custom_strategy.generate_signals(indicator_frames[symbol])
+                except Exception as e:
+                    logger.error("Error generating signals for %s: %s", symbol, e)
+        
+        # Signal counts are only worth computing when they will be logged
+        if logger.isEnabledFor(logging.INFO):
+            for symbol, df_with_signals in results.items():
+                logger.info("Analyzed data for %s: %s candles, %s buy signals, %s sell signals",
+                            symbol, len(df_with_signals),
+                            np.count_nonzero(df_with_signals['Buy_Signal'].to_numpy()),
+                            np.count_nonzero(df_with_signals['Sell_Signal'].to_numpy()))
         
         return results
     
-    def get_trading_opportunities(self, data: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
+    def shutdown(self) -> None:
+        """
+        Stop the indicator worker processes, if any were started.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+    
+    def get_trading_opportunities(self, data: Dict[str, pd.DataFrame]) -> List[Opportunity]:
         """
         Get current trading opportunities based on analyzed data.
         
@@ -76,41 +149,34 @@ class StrategyModule:
         
         for symbol, df in data.items():
             try:
-                # Get the latest data point
-                latest = df.iloc[-1].copy()
-                
-                # Check if there's a signal
-                if latest['Buy_Signal'] or latest['Sell_Signal']:
-                    signal_type = 'buy' if latest['Buy_Signal'] else 'sell'
+                # Check the latest signal flags first; most symbols have none
+                buy_signal = bool(df['Buy_Signal'].to_numpy()[-1])
+                if buy_signal or df['Sell_Signal'].to_numpy()[-1]:
+                    signal_type = 'buy' if buy_signal else 'sell'
                     
-                    opportunity = {
-                        'symbol': symbol,
-                        'timestamp': latest.name,
-                        'price': latest['Close'],
-                        'type': signal_type,
-                        'signal_strength': latest['Signal_Strength'],
-                        'indicators': {
-                            'rsi': latest.get('RSI_14', None),
-                            'macd': latest.get('MACD', None),
-                            'macd_signal': latest.get('MACD_Signal', None),
-                            'bb_width': latest.get('BB_Width', None)
-                        }
-                    }
+                    # Get the latest data point as plain scalars
+                    latest = {col: df[col].to_numpy()[-1] for col in self._latest_columns if col in df.columns}
                     
-                    # Calculate stop loss and take profit
-                    if signal_type == 'buy':
-                        opportunity['stop_loss'] = self.custom_strategy._calculate_stop_loss(latest, 'buy')
-                        opportunity['take_profit'] = self.custom_strategy._calculate_take_profit(latest, 'buy')
-                    else:
-                        opportunity['stop_loss'] = self.custom_strategy._calculate_stop_loss(latest, 'sell')
-                        opportunity['take_profit'] = self.custom_strategy._calculate_take_profit(latest, 'sell')
+                    opportunity = Opportunity(
+                        symbol,
+                        df.index[-1],
+                        latest['Close'],
+                        signal_type,
+                        latest['Signal_Strength'],
+                        latest.get('RSI_14'),
+                        latest.get('MACD'),
+                        latest.get('MACD_Signal'),
+                        latest.get('BB_Width'),
+                        self.custom_strategy._calculate_stop_loss(latest, signal_type),
+                        self.custom_strategy._calculate_take_profit(latest, signal_type)
+                    )
                     
                     opportunities.append(opportunity)
                     
-                    logger.info(f"Found {signal_type} opportunity for {symbol} at {latest['Close']}")
+                    logger.info("Found %s opportunity for %s at %s", signal_type, symbol, latest['Close'])
                 
             except Exception as e:
-                logger.error(f"Error getting trading opportunities for {symbol}: {e}")
+                logger.error("Error getting trading opportunities for %s: %s", symbol, e)
         
         return opportunities
     
@@ -127,12 +193,17 @@ class StrategyModule:
         """
         exit_signals = []
         
+        # Group positions by symbol so each symbol's data is looked up once
+        positions_by_symbol = defaultdict(list)
         for position in positions:
-            symbol = position['symbol']
+            positions_by_symbol[position['symbol']].append(position)
+        
+        for symbol, symbol_positions in positions_by_symbol.items():
+            if symbol not in data:
+                continue
+            df = data[symbol]
             
-            if symbol in data:
-                df = data[symbol]
-                
+            for position in symbol_positions:
                 try:
                     # Get exit points for this position
                     exit_points = self.custom_strategy.get_exit_points(df, position)
@@ -141,10 +212,10 @@ class StrategyModule:
                     if exit_points:
                         exit_signals.extend(exit_points)
                         
-                        logger.info(f"Found exit signal for {symbol} position entered at {position['timestamp']}")
+                        logger.info("Found exit signal for %s position entered at %s", symbol, position['timestamp'])
                     
                 except Exception as e:
-                    logger.error(f"Error getting exit signals for {symbol}: {e}")
+                    logger.error("Error getting exit signals for %s: %s", symbol, e)
         
         return exit_signals
     
@@ -158,11 +229,18 @@ class StrategyModule:
         Returns:
             Dictionary with optimized parameters
         """
-        # Combine all data for optimization
-        combined_data = pd.concat([df for df in data.values()], axis=0)
+        # Stack the OHLCV columns of all symbols into a single preallocated buffer
+        columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        total = sum(len(df) for df in data.values())
+        combined_data = np.empty((total, len(columns)), dtype=np.float64)
+        
+        offset = 0
+        for df in data.values():
+            combined_data[offset:offset + len(df)] = df[columns].to_numpy(dtype=np.float64)
+            offset += len(df)
         
         # Optimize parameters
         optimized_params = self.custom_strategy.optimize_parameters(combined_data)
         
-        logger.info(f"Optimized strategy parameters: {optimized_params}")
+        logger.info("Optimized strategy parameters: %s", optimized_params)
         return optimized_params
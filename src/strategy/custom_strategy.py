@@ -3,12 +3,17 @@ Custom trading strategy implementation combining multiple indicators.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import pandas as pd
 import numpy as np
 
 from src.strategy.strategy import Strategy
 from src.strategy.indicator_calculator import IndicatorCalculator
+from src.strategy import kernels
+from src.strategy.streaming_indicators import (
+    StreamingATR, StreamingBB, StreamingEMA, StreamingMACD, StreamingRSI, StreamingSMA, StreamingStochastic
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +58,20 @@ class CustomStrategy(Strategy):
         
         self.atr_period = config.get('strategy', 'atr_period', default=14)
         self.atr_multiplier = config.get('strategy', 'atr_multiplier', default=2.0)
+        self._atr_col = f'ATR_{self.atr_period}'
         
         # Trailing stop loss parameters
         self.trailing_stop_pct = config.get('strategy', 'trailing_stop_pct', default=2.0)
         
+        # Signal strength needed for a buy/sell signal
+        self.signal_threshold = config.get('strategy', 'signal_threshold', default=3)
+        
+        # Float precision of the indicator columns ('float64' or 'float32')
+        self.indicator_dtype = np.dtype(config.get('strategy', 'indicator_dtype', default='float64'))
+        
+        # Incremental indicator state per symbol, used by on_tick
+        self._streaming: Dict[str, Dict[str, Any]] = {}
+        
         logger.debug("Custom strategy initialized with parameters:")
         logger.debug(f"RSI: period={self.rsi_period}, overbought={self.rsi_overbought}, oversold={self.rsi_oversold}")
         logger.debug(f"MACD: fast={self.macd_fast}, slow={self.macd_slow}, signal={self.macd_signal}")
@@ -77,14 +92,19 @@ class CustomStrategy(Strategy):
         Returns:
             DataFrame with added indicator columns
         """
+        # The indicator calculator adds columns in place, so work on a single copy
         df = data.copy()
         
+        # Read the OHLCV columns once and share them between the indicators
+        arrays = self.indicator_calculator.ohlcv_arrays(df, dtype=self.indicator_dtype)
+        
         # Calculate RSI
         df = self.indicator_calculator.add_rsi(
             df, 
             period=self.rsi_period, 
             overbought=self.rsi_overbought, 
-            oversold=self.rsi_oversold
+            oversold=self.rsi_oversold,
+            arrays=arrays
         )
         
         # Calculate MACD
@@ -92,7 +112,8 @@ class CustomStrategy(Strategy):
             df, 
             fast=self.macd_fast, 
             slow=self.macd_slow, 
-            signal=self.macd_signal
+            signal=self.macd_signal,
+            arrays=arrays
         )
         # Calculate Moving Averages
         df = self.indicator_calculator.add_moving_averages(df,
@@ -101,13 +122,16 @@ class CustomStrategy(Strategy):
                                                            sma_long_period=self.sma_long_period,
                                                            ema_short_period=self.ema_short_period,
                                                            ema_medium_period=self.ema_medium_period,
-                                                           ema_long_period=self.ema_long_period)
+                                                           ema_long_period=self.ema_long_period,
+                                                           arrays=arrays)
         
         # Calculate Bollinger Bands
         df = self.indicator_calculator.add_bollinger_bands(
             df, 
             period=self.bb_period, 
-            std_dev=self.bb_std_dev
+            std_dev=self.bb_std_dev,
+            arrays=arrays,
+            compute_squeeze=False  # Not used by the strategy
         )
         
         # Calculate Stochastic Oscillator
@@ -115,70 +139,142 @@ class CustomStrategy(Strategy):
             df, 
             k_period=self.stoch_k_period, 
             d_period=self.stoch_d_period, 
-            smooth_k=self.stoch_smooth_k
+            smooth_k=self.stoch_smooth_k,
+            arrays=arrays
         )
         
         # Calculate ATR for volatility measurement
         df = self.indicator_calculator.add_atr(
             df, 
-            period=self.atr_period
+            period=self.atr_period,
+            arrays=arrays
         )
         
         # Calculate volume indicators
-        df = self.indicator_calculator.add_volume_indicators(df, sma_short_period=self.sma_short_period)
+        df = self.indicator_calculator.add_volume_indicators(df, sma_short_period=self.sma_short_period,
+                                                             arrays=arrays,
+                                                             compute_obv=False)  # Not used by the strategy
         
-        # log all indicators calculated: label and value
-        for col in df.columns:
-            if col.startswith('RSI_') or col.startswith('MACD_') or col.startswith('EMA_') or col.startswith('SMA_') or col.startswith('BB_') or col.startswith('Stoch_') or col.startswith('ATR_'):
-                logger.debug(f"{col}: {df[col].iloc[-1]}")  
+        # log all indicators calculated: label and value (only worth reading them when debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            for col in df.columns:
+                if col.startswith(('RSI_', 'MACD_', 'EMA_', 'SMA_', 'BB_', 'Stoch_', 'ATR_')):
+                    logger.debug("%s: %s", col, df[col].iloc[-1])
         
-        logger.debug(f"Calculated indicators for {len(df)} data points")
+        logger.debug("Calculated indicators for %s data points", len(df))
         
         return df
     
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def calculate_indicators_batch(self, data: Dict[str, pd.DataFrame],
+                                   max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
         """
-        Generate trading signals based on indicators.
+        Calculate technical indicators for several symbols in parallel.
+        
+        The indicator kernels release the GIL, so the symbols are spread over
+        threads and their compiled loops run on separate cores.
         
         Args:
-            data: DataFrame with OHLCV data and indicators
+            data: Dictionary mapping symbols to DataFrames with OHLCV data
+            max_workers: Number of threads (defaults to ThreadPoolExecutor's choice)
             
         Returns:
-            DataFrame with added signal columns
+            Dictionary mapping symbols to DataFrames with added indicator columns
         """
-        df = data.copy()
+        if not data:
+            return {}
         
-        # Initialize signal columns
-        df['Buy_Signal'] = False
-        df['Sell_Signal'] = False
-        df['Signal_Strength'] = 0  # -5 to 5 scale, negative for sell, positive for buy
-        
-        # RSI signals
-        df['Signal_Strength'] += np.where(df['RSI_Oversold'], 1, 0)  # Oversold condition (buy signal)
-        df['Signal_Strength'] -= np.where(df['RSI_Overbought'], 1, 0)  # Overbought condition (sell signal)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(self.calculate_indicators, data.values())
+            return dict(zip(data.keys(), results))
+    
+    def on_tick(self, symbol: str, candle: Mapping[str, float]) -> Dict[str, float]:
+        """
+        Update the indicators of a symbol with one closed candle.
         
-        # MACD signals
-        df['Signal_Strength'] += np.where(df['MACD_Bullish_Crossover'], 1, 0)  # Bullish crossover (buy signal)
-        df['Signal_Strength'] -= np.where(df['MACD_Bearish_Crossover'], 1, 0)  # Bearish crossover (sell signal)
+        Each call costs O(1), unlike calculate_indicators which recomputes the
+        whole history. Feed every closed candle exactly once, in order.
         
-        # Bollinger Bands signals
-        df['Signal_Strength'] += np.where(df['BB_Lower_Touch'], 1, 0)  # Price touches lower band (buy signal)
-        df['Signal_Strength'] -= np.where(df['BB_Upper_Touch'], 1, 0)  # Price touches upper band (sell signal)
+        Args:
+            symbol: Trading pair symbol
+            candle: Mapping with 'High', 'Low', 'Close' and 'Volume' of the candle
+            
+        Returns:
+            Dictionary with the latest indicator values (NaN until warmed up)
+        """
+        state = self._streaming.get(symbol)
+        if state is None:
+            state = self._streaming[symbol] = {
+                'sma': [StreamingSMA(period) for period in (self.sma_short_period, self.sma_medium_period,
+                                                            self.sma_long_period)],
+                'ema': [StreamingEMA(period) for period in (self.ema_short_period, self.ema_medium_period,
+                                                            self.ema_long_period)],
+                'rsi': StreamingRSI(self.rsi_period),
+                'macd': StreamingMACD(self.macd_fast, self.macd_slow, self.macd_signal),
+                'bb': StreamingBB(self.bb_period, self.bb_std_dev),
+                'stoch': StreamingStochastic(self.stoch_k_period, self.stoch_d_period, self.stoch_smooth_k),
+                'atr': StreamingATR(self.atr_period),
+                'volume_sma': StreamingSMA(self.sma_short_period)
+            }
         
-        # Stochastic signals
-        df['Signal_Strength'] += np.where(df['Stoch_Bullish_Crossover'] & (df['Stoch_K'] < 30), 1, 0)  # Bullish crossover in oversold region
-        df['Signal_Strength'] -= np.where(df['Stoch_Bearish_Crossover'] & (df['Stoch_K'] > 70), 1, 0)  # Bearish crossover in overbought region
+        high, low, close = candle['High'], candle['Low'], candle['Close']
+        macd, macd_signal, macd_histogram = state['macd'].update(close)
+        bb_upper, bb_middle, bb_lower = state['bb'].update(close)
+        stoch_k, stoch_d = state['stoch'].update(high, low, close)
+        
+        values = {f'SMA_{sma.period}': sma.update(close) for sma in state['sma']}
+        values.update({f'EMA_{ema.period}': ema.update(close) for ema in state['ema']})
+        values.update({
+            f'RSI_{self.rsi_period}': state['rsi'].update(close),
+            'MACD': macd,
+            'MACD_Signal': macd_signal,
+            'MACD_Histogram': macd_histogram,
+            'BB_Upper': bb_upper,
+            'BB_Middle': bb_middle,
+            'BB_Lower': bb_lower,
+            'Stoch_K': stoch_k,
+            'Stoch_D': stoch_d,
+            self._atr_col: state['atr'].update(high, low, close),
+            f'Volume_SMA_{self.sma_short_period}': state['volume_sma'].update(candle['Volume'])
+        })
+        return values
+    
+    def generate_signals(self, data: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Generate trading signals based on indicators.
         
-        # Volume confirmation
-        df['Signal_Strength'] += np.where(df['High_Volume'] & (df['Signal_Strength'] > 0), 1, 0)  # High volume confirms buy signal
-        df['Signal_Strength'] -= np.where(df['High_Volume'] & (df['Signal_Strength'] < 0), 1, 0)  # High volume confirms sell signal
+        Args:
+            data: DataFrame with OHLCV data and indicators
+            copy: Whether to work on a copy; pass False to add the columns to data in place
+            
+        Returns:
+            DataFrame with added signal columns
+        """
+        df = data.copy() if copy else data
+        
+        # Score all indicator flags in a single compiled pass
+        # -5 to 5 scale, negative for sell, positive for buy
+        strength = kernels.signal_strength(
+            df['RSI_Oversold'].to_numpy(dtype=np.bool_),
+            df['RSI_Overbought'].to_numpy(dtype=np.bool_),
+            df['MACD_Bullish_Crossover'].to_numpy(dtype=np.bool_),
+            df['MACD_Bearish_Crossover'].to_numpy(dtype=np.bool_),
+            df['BB_Lower_Touch'].to_numpy(dtype=np.bool_),
+            df['BB_Upper_Touch'].to_numpy(dtype=np.bool_),
+            df['Stoch_Bullish_Crossover'].to_numpy(dtype=np.bool_),
+            df['Stoch_Bearish_Crossover'].to_numpy(dtype=np.bool_),
+            df['Stoch_K'].to_numpy(),  # Kept in the indicator dtype, the kernel compiles per dtype
+            df['High_Volume'].to_numpy(dtype=np.bool_)
+        )
         
-        # Generate final buy/sell signals based on signal strength
-        signal_threshold = self.config.get('strategy', 'signal_threshold', default=3)
-        df['Buy_Signal'] = df['Signal_Strength'] >= signal_threshold # Strong buy signal
-        df['Sell_Signal'] = df['Signal_Strength'] <= -signal_threshold  # Strong sell signal
+        # Generate final buy/sell signals based on signal strength, assigning each column once
+        buy = strength >= self.signal_threshold  # Strong buy signal
+        sell = strength <= -self.signal_threshold  # Strong sell signal
+        df['Buy_Signal'] = buy
+        df['Sell_Signal'] = sell
+        df['Signal_Strength'] = strength
         
-        logger.debug(f"Generated signals: {df['Buy_Signal'].sum()} buy signals, {df['Sell_Signal'].sum()} sell signals")
+        logger.debug("Generated signals: %s buy signals, %s sell signals",
+                     np.count_nonzero(buy), np.count_nonzero(sell))
         return df
     
     def get_entry_points(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -191,40 +287,45 @@ class CustomStrategy(Strategy):
         Returns:
             List of entry points with relevant information
         """
-        df = data.copy()
+        df = data
         entry_points = []
         
-        # Find buy signals
-        buy_signals = df[df['Buy_Signal']].copy()
-        
-        for idx, row in buy_signals.iterrows():
-            entry_point = {
-                'timestamp': idx,
-                'symbol': row.get('symbol', 'Unknown'),
-                'price': row['Close'],
-                'type': 'buy',
-                'signal_strength': row['Signal_Strength'],
-                'stop_loss': self._calculate_stop_loss(row, 'buy'),
-                'take_profit': self._calculate_take_profit(row, 'buy')
-            }
-            entry_points.append(entry_point)
-        
-        # Find sell signals (for short positions)
-        sell_signals = df[df['Sell_Signal']].copy()
-        
-        for idx, row in sell_signals.iterrows():
-            entry_point = {
-                'timestamp': idx,
-                'symbol': row.get('symbol', 'Unknown'),
-                'price': row['Close'],
-                'type': 'sell',
-                'signal_strength': row['Signal_Strength'],
-                'stop_loss': self._calculate_stop_loss(row, 'sell'),
-                'take_profit': self._calculate_take_profit(row, 'sell')
-            }
-            entry_points.append(entry_point)
+        # Columns the stop loss and take profit are derived from
+        level_columns = ('Close', self._atr_col)
         
-        logger.debug(f"Found {len(entry_points)} entry points")
+        # Buy signals, then sell signals (for short positions)
+        for signal_type, signal_column in (('buy', 'Buy_Signal'), ('sell', 'Sell_Signal')):
+            # Positions of the signal rows; only the columns needed below are gathered
+            rows = np.flatnonzero(df[signal_column].to_numpy())
+            if rows.size == 0:
+                continue
+            
+            # Compute the levels for all signal rows at once from the column arrays
+            levels = {col: df[col].to_numpy()[rows] for col in level_columns if col in df.columns}
+            stop_losses = self._calculate_stop_loss(levels, signal_type)
+            take_profits = self._calculate_take_profit(levels, signal_type)
+            
+            if 'symbol' in df.columns:
+                symbols = df['symbol'].to_numpy()[rows]
+            else:
+                symbols = ['Unknown'] * rows.size
+            
+            entry_points.extend(
+                {
+                    'timestamp': timestamp,
+                    'symbol': symbol,
+                    'price': price,
+                    'type': signal_type,
+                    'signal_strength': strength,
+                    'stop_loss': stop_loss,
+                    'take_profit': take_profit
+                }
+                for timestamp, symbol, price, strength, stop_loss, take_profit in zip(
+                    df.index[rows], symbols, levels['Close'], df['Signal_Strength'].to_numpy()[rows],
+                    stop_losses, take_profits)
+            )
+        
+        logger.debug("Found %s entry points", len(entry_points))
         return entry_points
     
     def get_exit_points(self, data: pd.DataFrame, position: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -247,8 +348,7 @@ class CustomStrategy(Strategy):
         #     logger.error("Position object is missing required keys: 'price' or 'timestamp'")
         #     return []
     
-        df = data.copy()
-        exit_points = []
+        df = data
         
         position_type = position['type']
         entry_price = position['price']
@@ -256,53 +356,69 @@ class CustomStrategy(Strategy):
         
         # Filter data to only include rows after entry
         if isinstance(entry_time, pd.Timestamp):
-            df = df[df.index > entry_time]
+            if df.index.is_monotonic_increasing:
+                # Candles are sorted, so the rows after entry are a tail slice
+                df = df.iloc[df.index.searchsorted(entry_time, side='right'):]
+            else:
+                df = df[df.index > entry_time]
         
         # If no data after entry, return empty list
         if len(df) == 0:
             return []
         
-        # Calculate trailing stop loss
+        # Calculate trailing stop loss (kept as a Series so the data is never modified)
         if position_type == 'buy':
             # For long positions
-            df['Trailing_Stop'] = self._calculate_trailing_stop_long(df, entry_price)
+            trailing_stop = self._calculate_trailing_stop_long(df, entry_price)
             
             # Exit when price crosses below trailing stop or opposite signal appears
-            exit_condition = (df['Low'] < df['Trailing_Stop']) | df['Sell_Signal']
+            exit_condition = (df['Low'].to_numpy() < trailing_stop.to_numpy()) | df['Sell_Signal'].to_numpy()
         else:
             # For short positions
-            df['Trailing_Stop'] = self._calculate_trailing_stop_short(df, entry_price)
+            trailing_stop = self._calculate_trailing_stop_short(df, entry_price)
             
             # Exit when price crosses above trailing stop or opposite signal appears
-            exit_condition = (df['High'] > df['Trailing_Stop']) | df['Buy_Signal']
+            exit_condition = (df['High'].to_numpy() > trailing_stop.to_numpy()) | df['Buy_Signal'].to_numpy()
         
-        # Find exit points
-        exit_signals = df[exit_condition].copy()
+        # Find exit points; only the columns needed below are gathered
+        rows = np.flatnonzero(exit_condition)
+        if rows.size == 0:
+            return []
         
-        for idx, row in exit_signals.iterrows():
-            exit_reason = 'trailing_stop'
-            if (position_type == 'buy' and row['Sell_Signal']) or (position_type == 'sell' and row['Buy_Signal']):
-                exit_reason = 'signal_reversal'
-            
-            exit_point = {
-                'timestamp': idx,
-                'symbol': row.get('symbol', position.get('symbol', 'Unknown')),
-                'price': row['Close'],
+        exit_prices = df['Close'].to_numpy()[rows]
+        profit_pcts = self._calculate_profit_percentage(entry_price, exit_prices, position_type)
+        
+        # An opposite signal takes precedence over the trailing stop as the exit reason
+        reversal_column = 'Sell_Signal' if position_type == 'buy' else 'Buy_Signal'
+        exit_reasons = np.where(df[reversal_column].to_numpy()[rows], 'signal_reversal', 'trailing_stop')
+        
+        if 'symbol' in df.columns:
+            symbols = df['symbol'].to_numpy()[rows]
+        else:
+            symbols = [position.get('symbol', 'Unknown')] * rows.size
+        
+        exit_points = [
+            {
+                'timestamp': timestamp,
+                'symbol': symbol,
+                'price': price,
                 'type': 'exit_' + position_type,
-                'reason': exit_reason,
-                'profit_pct': self._calculate_profit_percentage(entry_price, row['Close'], position_type)
+                'reason': str(reason),
+                'profit_pct': profit_pct
             }
-            exit_points.append(exit_point)
+            for timestamp, symbol, price, reason, profit_pct in zip(
+                df.index[rows], symbols, exit_prices, exit_reasons, profit_pcts)
+        ]
         
-        logger.debug(f"Found {len(exit_points)} exit points for position entered at {entry_time}")
+        logger.debug("Found %s exit points for position entered at %s", len(exit_points), entry_time)
         return exit_points
     
-    def optimize_parameters(self, data: pd.DataFrame, **kwargs) -> Dict[str, Any]:
+    def optimize_parameters(self, data: np.ndarray, **kwargs) -> Dict[str, Any]:
         """
         Optimize strategy parameters.
         
         Args:
-            data: DataFrame with OHLCV data
+            data: Array of shape (n_candles, 5) with Open, High, Low, Close and Volume columns
             **kwargs: Additional parameters for optimization
             
         Returns:
@@ -331,19 +447,19 @@ class CustomStrategy(Strategy):
         logger.debug("Parameter optimization not implemented, returning current parameters")
         return optimized_params
     
-    def _calculate_stop_loss(self, row: pd.Series, position_type: str) -> float:
+    def _calculate_stop_loss(self, row: Mapping[str, Any], position_type: str) -> float:
         """
         Calculate initial stop loss price.
         
         Args:
-            row: DataFrame row with OHLCV and indicator data
+            row: DataFrame row, or mapping of column to value (or to an array of values)
             position_type: Type of position ('buy' or 'sell')
             
         Returns:
-            Stop loss price
+            Stop loss price (an array when given arrays)
         """
 
-        atr = row.get(f'ATR_{self.atr_period}', 0)
+        atr = row.get(self._atr_col, 0)
         
         if position_type == 'buy':
             # For long positions, stop loss is below entry price
@@ -352,19 +468,19 @@ class CustomStrategy(Strategy):
             # For short positions, stop loss is above entry price
             return row['Close'] + (atr * self.atr_multiplier)
         
-    def _calculate_take_profit(self, row: pd.Series, position_type: str) -> float:
+    def _calculate_take_profit(self, row: Mapping[str, Any], position_type: str) -> float:
         """
         Calculate take profit price.
         
         Args:
-            row: DataFrame row with OHLCV and indicator data
+            row: DataFrame row, or mapping of column to value (or to an array of values)
             position_type: Type of position ('buy' or 'sell')
             
         Returns:
-            Take profit price
+            Take profit price (an array when given arrays)
         """
 
-        atr = row.get(f'ATR_{self.atr_period}', 0)
+        atr = row.get(self._atr_col, 0)
         
         if position_type == 'buy':
             # For long positions, take profit is above entry price
@@ -384,20 +500,16 @@ class CustomStrategy(Strategy):
         Returns:
             Series with trailing stop prices
         """
-        # Initialize trailing stop at entry price minus percentage
-        initial_stop = entry_price * (1 - self.trailing_stop_pct / 100)
+        factor = 1 - self.trailing_stop_pct / 100
         
-        # Calculate highest high since entry
-        highest_high = df['High'].cummax()
-        
-        # Calculate trailing stop as highest high minus percentage
-        trailing_stop = highest_high * (1 - self.trailing_stop_pct / 100)
+        # Initialize trailing stop at entry price minus percentage
+        initial_stop = entry_price * factor
         
-        # Trailing stop can only increase, never decrease
-        trailing_stop = trailing_stop.cummax()
+        # Trailing stop follows the highest high since entry, so it can only increase
+        trailing_stop = np.maximum.accumulate(df['High'].to_numpy()) * factor
         
         # Ensure trailing stop is at least the initial stop
-        trailing_stop = trailing_stop.clip(lower=initial_stop)
+        trailing_stop = pd.Series(np.maximum(trailing_stop, initial_stop), index=df.index, name='Trailing_Stop')
         
         logger.debug("Calculate Trailing Stop Loss for LONG Position")
 
@@ -414,20 +526,16 @@ class CustomStrategy(Strategy):
         Returns:
             Series with trailing stop prices
         """
-        # Initialize trailing stop at entry price plus percentage
-        initial_stop = entry_price * (1 + self.trailing_stop_pct / 100)
+        factor = 1 + self.trailing_stop_pct / 100
         
-        # Calculate lowest low since entry
-        lowest_low = df['Low'].cummin()
-        
-        # Calculate trailing stop as lowest low plus percentage
-        trailing_stop = lowest_low * (1 + self.trailing_stop_pct / 100)
+        # Initialize trailing stop at entry price plus percentage
+        initial_stop = entry_price * factor
         
-        # Trailing stop can only decrease, never increase
-        trailing_stop = trailing_stop.cummin()
+        # Trailing stop follows the lowest low since entry, so it can only decrease
+        trailing_stop = np.minimum.accumulate(df['Low'].to_numpy()) * factor
         
         # Ensure trailing stop is at most the initial stop
-        trailing_stop = trailing_stop.clip(upper=initial_stop)
+        trailing_stop = pd.Series(np.minimum(trailing_stop, initial_stop), index=df.index, name='Trailing_Stop')
         
         logger.debug("Calculate Trailing Stop Loss for SHORT Position")
 
@@ -439,11 +547,11 @@ class CustomStrategy(Strategy):
         
         Args:
             entry_price: Entry price for the position
-            exit_price: Exit price for the position
+            exit_price: Exit price for the position (or an array of exit prices)
             position_type: Type of position ('buy' or 'sell')
             
         Returns:
-            Profit percentage
+            Profit percentage (an array when given an array of exit prices)
         """
         # logger.debug("Calculate Profit Percentage")
 
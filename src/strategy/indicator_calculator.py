@@ -3,15 +3,20 @@ Calculator for technical indicators used in trading strategies.
 """
 
 import logging
+from typing import Dict, Optional
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
 
+from src.strategy import kernels
+
 logger = logging.getLogger(__name__)
 
 class IndicatorCalculator:
     """
     Calculates technical indicators for trading strategies.
+    
+    The add_* methods add their columns to the given DataFrame in place and
+    return it; copy the data first if the original must stay unchanged.
     """
     
     def __init__(self):
@@ -27,7 +32,8 @@ class IndicatorCalculator:
                             sma_long_period,
                             ema_short_period,
                             ema_medium_period,
-                            ema_long_period ) -> pd.DataFrame:
+                            ema_long_period,
+                            arrays: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """
         Add simple moving averages to the DataFrame.
         
@@ -36,29 +42,72 @@ class IndicatorCalculator:
             short_period: Period for short-term SMA
             medium_period: Period for medium-term SMA
             long_period: Period for long-term SMA
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
             
         Returns:
-            DataFrame with added moving average columns
+            The same DataFrame, with moving average columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
+        close = arrays['Close']
         
         # Calculate SMAs
-        df[f'SMA_{sma_short_period}'] = ta.sma(df['Close'], length=sma_short_period)
-        df[f'SMA_{sma_medium_period}'] = ta.sma(df['Close'], length=sma_medium_period)
-        df[f'SMA_{sma_long_period}'] = ta.sma(df['Close'], length=sma_long_period)
+        df[f'SMA_{sma_short_period}'] = kernels.sma(close, sma_short_period)
+        df[f'SMA_{sma_medium_period}'] = kernels.sma(close, sma_medium_period)
+        df[f'SMA_{sma_long_period}'] = kernels.sma(close, sma_long_period)
         
         # Calculate EMAs
-        df[f'EMA_{ema_short_period}'] = ta.ema(df['Close'], length=ema_short_period)
-        df[f'EMA_{ema_medium_period}'] = ta.ema(df['Close'], length=ema_medium_period)
-        df[f'EMA_{ema_long_period}'] = ta.ema(df['Close'], length=ema_long_period)
+        df[f'EMA_{ema_short_period}'] = kernels.ema(close, ema_short_period)
+        df[f'EMA_{ema_medium_period}'] = kernels.ema(close, ema_medium_period)
+        df[f'EMA_{ema_long_period}'] = kernels.ema(close, ema_long_period)
         
         logger.debug("Added Moving Averages to DataFrame")
         return df
     
+    @staticmethod
+    def ohlcv_arrays(df: pd.DataFrame, dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Read the OHLCV columns as float arrays for the indicator kernels.
+        
+        Columns already of the requested dtype are returned as views, without copying.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            dtype: Float dtype of the arrays; indicators computed from them have the same dtype
+            
+        Returns:
+            Dictionary mapping 'Open', 'High', 'Low', 'Close' and 'Volume' to arrays
+        """
+        return {col: df[col].to_numpy(dtype=dtype, copy=False)
+                for col in ('Open', 'High', 'Low', 'Close', 'Volume')}
+    
+    @staticmethod
+    def _crossovers(a: np.ndarray, b: np.ndarray):
+        """
+        Find where one series crosses another.
+        
+        Args:
+            a: Series that crosses
+            b: Series being crossed
+            
+        Returns:
+            Tuple of boolean arrays (crossed above, crossed below)
+        """
+        # Work on the difference so both directions share one temporary; NaN
+        # compares False both ways, so no crossover is reported next to missing values
+        diff = a - b
+        
+        bullish = np.zeros(diff.shape[0], dtype=bool)
+        bearish = np.zeros(diff.shape[0], dtype=bool)
+        np.logical_and(diff[1:] > 0, diff[:-1] <= 0, out=bullish[1:])
+        np.logical_and(diff[1:] < 0, diff[:-1] >= 0, out=bearish[1:])
+        return bullish, bearish
+    
     def add_rsi(self, df: pd.DataFrame, 
                 period: int = 14, 
                 overbought: int = 70, 
-                oversold: int = 30) -> pd.DataFrame:
+                oversold: int = 30,
+                arrays: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """
         Add Relative Strength Index (RSI) to the DataFrame.
         
@@ -67,18 +116,21 @@ class IndicatorCalculator:
             period: Period for RSI calculation
             overbought: Overbought threshold
             oversold: Oversold threshold
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
             
         Returns:
-            DataFrame with added RSI columns
+            The same DataFrame, with RSI columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
         
         # Calculate RSI
-        df[f'RSI_{period}'] = ta.rsi(df['Close'], length=period)
+        rsi = kernels.rsi(arrays['Close'], period)
+        df[f'RSI_{period}'] = rsi
         
         # Add overbought/oversold indicators
-        df['RSI_Overbought'] = df[f'RSI_{period}'] > overbought
-        df['RSI_Oversold'] = df[f'RSI_{period}'] < oversold
+        df['RSI_Overbought'] = rsi > overbought
+        df['RSI_Oversold'] = rsi < oversold
         
         logger.debug("Added RSI to DataFrame")
         return df
@@ -87,7 +139,8 @@ class IndicatorCalculator:
                  df: pd.DataFrame, 
                  fast: int = 12, 
                  slow: int = 26, 
-                 signal: int = 9) -> pd.DataFrame:
+                 signal: int = 9,
+                 arrays: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """
         Add Moving Average Convergence Divergence (MACD) to the DataFrame.
         
@@ -96,23 +149,24 @@ class IndicatorCalculator:
             fast: Fast period
             slow: Slow period
             signal: Signal period
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
             
         Returns:
-            DataFrame with added MACD columns
+            The same DataFrame, with MACD columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
         
         # Calculate MACD
-        macd = ta.macd(df['Close'], fast=fast, slow=slow, signal=signal)
+        macd, macd_signal, macd_histogram = kernels.macd(arrays['Close'], fast, slow, signal)
         
         # Add MACD columns to the DataFrame
-        df['MACD'] = macd[f'MACD_{fast}_{slow}_{signal}']
-        df['MACD_Signal'] = macd[f'MACDs_{fast}_{slow}_{signal}']
-        df['MACD_Histogram'] = macd[f'MACDh_{fast}_{slow}_{signal}']
+        df['MACD'] = macd
+        df['MACD_Signal'] = macd_signal
+        df['MACD_Histogram'] = macd_histogram
         
         # Add MACD crossover signals
-        df['MACD_Bullish_Crossover'] = (df['MACD'] > df['MACD_Signal']) & (df['MACD'].shift(1) <= df['MACD_Signal'].shift(1))
-        df['MACD_Bearish_Crossover'] = (df['MACD'] < df['MACD_Signal']) & (df['MACD'].shift(1) >= df['MACD_Signal'].shift(1))
+        df['MACD_Bullish_Crossover'], df['MACD_Bearish_Crossover'] = self._crossovers(macd, macd_signal)
         
         logger.debug("Added MACD to DataFrame")
         return df
@@ -120,7 +174,9 @@ class IndicatorCalculator:
     def add_bollinger_bands(self, 
                             df: pd.DataFrame, 
                             period: int = 20, 
-                            std_dev: float = 2.0) -> pd.DataFrame:
+                            std_dev: float = 2.0,
+                            arrays: Optional[Dict[str, np.ndarray]] = None,
+                            compute_squeeze: bool = True) -> pd.DataFrame:
         """
         Add Bollinger Bands to the DataFrame.
         
@@ -128,33 +184,40 @@ class IndicatorCalculator:
             df: DataFrame with OHLCV data
             period: Period for moving average
             std_dev: Number of standard deviations
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
+            compute_squeeze: Whether to add the BB_Squeeze column
             
         Returns:
-            DataFrame with added Bollinger Bands columns
+            The same DataFrame, with Bollinger Bands columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
         
         # Calculate Bollinger Bands
-        bbands = ta.bbands(df['Close'], length=period, std=std_dev)
+        upper, middle, lower = kernels.bollinger_bands(arrays['Close'], period, float(std_dev))
         
         # Add Bollinger Bands columns to the DataFrame
-        df['BB_Upper'] = bbands[f'BBU_{period}_{std_dev}']
-        df['BB_Middle'] = bbands[f'BBM_{period}_{std_dev}']
-        df['BB_Lower'] = bbands[f'BBL_{period}_{std_dev}']
+        df['BB_Upper'] = upper
+        df['BB_Middle'] = middle
+        df['BB_Lower'] = lower
         
-        # Calculate Bollinger Band width
-        df['BB_Width'] = (df['BB_Upper'] - df['BB_Lower']) / df['BB_Middle']
+        # Calculate Bollinger Band width, dividing in place to reuse the difference array
+        width = upper - lower
+        np.divide(width, middle, out=width)
+        df['BB_Width'] = width
         
         # Add Bollinger Band signals
-        df['BB_Squeeze'] = df['BB_Width'] < df['BB_Width'].rolling(window=50).mean()
-        df['BB_Upper_Touch'] = df['High'] >= df['BB_Upper']
-        df['BB_Lower_Touch'] = df['Low'] <= df['BB_Lower']
+        if compute_squeeze:
+            df['BB_Squeeze'] = width < kernels.sma(width, 50)
+        df['BB_Upper_Touch'] = arrays['High'] >= upper
+        df['BB_Lower_Touch'] = arrays['Low'] <= lower
         
         logger.debug("Added Bollinger Bands to DataFrame")
         return df
     
     def add_stochastic(self, df: pd.DataFrame, k_period: int = 14, 
-                      d_period: int = 3, smooth_k: int = 3) -> pd.DataFrame:
+                      d_period: int = 3, smooth_k: int = 3,
+                      arrays: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """
         Add Stochastic Oscillator to the DataFrame.
         
@@ -163,70 +226,85 @@ class IndicatorCalculator:
             k_period: K period
             d_period: D period
             smooth_k: K smoothing period
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
             
         Returns:
-            DataFrame with added Stochastic Oscillator columns
+            The same DataFrame, with Stochastic Oscillator columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
         
         # Calculate Stochastic Oscillator
-        stoch = ta.stoch(df['High'], df['Low'], df['Close'], k=k_period, d=d_period, smooth_k=smooth_k)
+        stoch_k, stoch_d = kernels.stochastic(arrays['High'], arrays['Low'], arrays['Close'],
+                                              k_period, d_period, smooth_k)
         
         # Add Stochastic Oscillator columns to the DataFrame
-        df['Stoch_K'] = stoch[f'STOCHk_{k_period}_{d_period}_{smooth_k}']
-        df['Stoch_D'] = stoch[f'STOCHd_{k_period}_{d_period}_{smooth_k}']
+        df['Stoch_K'] = stoch_k
+        df['Stoch_D'] = stoch_d
         
         # Add Stochastic crossover signals
-        df['Stoch_Bullish_Crossover'] = (df['Stoch_K'] > df['Stoch_D']) & (df['Stoch_K'].shift(1) <= df['Stoch_D'].shift(1))
-        df['Stoch_Bearish_Crossover'] = (df['Stoch_K'] < df['Stoch_D']) & (df['Stoch_K'].shift(1) >= df['Stoch_D'].shift(1))
+        df['Stoch_Bullish_Crossover'], df['Stoch_Bearish_Crossover'] = self._crossovers(stoch_k, stoch_d)
         
         logger.debug("Added Stochastic Oscillator to DataFrame")
         return df
     
     def add_atr(self, 
                 df: pd.DataFrame, 
-                period: int = 14) -> pd.DataFrame:
+                period: int = 14,
+                arrays: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """
         Add Average True Range (ATR) to the DataFrame.
         
         Args:
             df: DataFrame with OHLCV data
             period: Period for ATR calculation
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
             
         Returns:
-            DataFrame with added ATR column
+            The same DataFrame, with the ATR column added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
         
         # Calculate ATR
-        df[f'ATR_{period}'] = ta.atr(df['High'], df['Low'], df['Close'], length=period)
+        df[f'ATR_{period}'] = kernels.atr(arrays['High'], arrays['Low'], arrays['Close'], period)
         
         logger.debug("Added ATR to DataFrame")
         return df
     
-    def add_volume_indicators(self, df: pd.DataFrame, sma_short_period) -> pd.DataFrame:
+    def add_volume_indicators(self, df: pd.DataFrame, sma_short_period,
+                              arrays: Optional[Dict[str, np.ndarray]] = None,
+                              compute_obv: bool = True) -> pd.DataFrame:
         """
         Add volume-based indicators to the DataFrame.
         
         Args:
             df: DataFrame with OHLCV data
+            sma_short_period: Period for the volume moving average
+            arrays: Column arrays from ohlcv_arrays(), so the columns are read once (optional)
+            compute_obv: Whether to add the OBV column
             
         Returns:
-            DataFrame with added volume indicator columns
+            The same DataFrame, with volume indicator columns added in place
         """
-        df = df.copy()
+        if arrays is None:
+            arrays = self.ohlcv_arrays(df)
+        volume = arrays['Volume']
         
         # Calculate On-Balance Volume (OBV)
-        df['OBV'] = ta.obv(df['Close'], df['Volume'])
+        if compute_obv:
+            df['OBV'] = kernels.obv(arrays['Close'], volume)
         
         # Calculate Volume Moving Average
-        df[f'Volume_SMA_{sma_short_period}'] = ta.sma(df['Volume'], length=sma_short_period)
+        volume_sma = kernels.sma(volume, sma_short_period)
+        df[f'Volume_SMA_{sma_short_period}'] = volume_sma
         
         # Calculate Volume Relative to Moving Average
-        df['Volume_Ratio'] = df['Volume'] / df[f'Volume_SMA_{sma_short_period}']
+        volume_ratio = volume / volume_sma
+        df['Volume_Ratio'] = volume_ratio
         
         # High volume signals
-        df['High_Volume'] = df['Volume_Ratio'] > 1.5
+        df['High_Volume'] = volume_ratio > 1.5
         
         logger.debug("Added volume indicators to DataFrame")
         return df
@@ -241,16 +319,25 @@ class IndicatorCalculator:
         Returns:
             DataFrame with all indicator columns
         """
+        # Copy once; the add_* methods then add their columns in place
         df = df.copy()
+        arrays = self.ohlcv_arrays(df)
         
         # Add all indicators
-        df = self.add_moving_averages(df)
-        df = self.add_rsi(df)
-        df = self.add_macd(df)
-        df = self.add_bollinger_bands(df)
-        df = self.add_stochastic(df)
-        df = self.add_atr(df)
-        df = self.add_volume_indicators(df)
+        df = self.add_moving_averages(df,
+                                      sma_short_period=20,
+                                      sma_medium_period=50,
+                                      sma_long_period=200,
+                                      ema_short_period=20,
+                                      ema_medium_period=50,
+                                      ema_long_period=200,
+                                      arrays=arrays)
+        df = self.add_rsi(df, arrays=arrays)
+        df = self.add_macd(df, arrays=arrays)
+        df = self.add_bollinger_bands(df, arrays=arrays)
+        df = self.add_stochastic(df, arrays=arrays)
+        df = self.add_atr(df, arrays=arrays)
+        df = self.add_volume_indicators(df, sma_short_period=20, arrays=arrays)
         
         logger.debug("Added all indicators to DataFrame")
         return df
@@ -0,0 +1,486 @@
+"""
+Compiled numeric kernels for technical indicators and signal scoring.
+
+Kernels take float (or bool) numpy arrays and return arrays of the same
+float dtype (except the cumulative OBV), so float32 inputs keep the
+outputs at half the size. They follow the pandas_ta conventions used by
+the strategy so results can be assigned back to the DataFrame column for
+column.
+"""
+
+import numpy as np
+
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, nogil=True)
+def sma(x, period):
+    """
+    Simple moving average.
+
+    Leading NaNs in the input are skipped, so the average can be applied to
+    the output of another indicator.
+
+    Args:
+        x: Input values
+        period: Window length
+
+    Returns:
+        Array with SMA values (NaN until the first full window)
+    """
+    n = x.shape[0]
+    out = np.full_like(x, np.nan)
+
+    # Find first valid value
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if n - start < period:
+        return out
+
+    total = 0.0
+    for i in range(start, n):
+        total += x[i]
+        if i >= start + period:
+            total -= x[i - period]
+        if i >= start + period - 1:
+            out[i] = total / period
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ema(x, period):
+    """
+    Exponential moving average seeded with the SMA of the first window.
+
+    Leading NaNs in the input are skipped, matching pandas_ta's handling
+    of the MACD signal line.
+
+    Args:
+        x: Input values
+        period: EMA period
+
+    Returns:
+        Array with EMA values (NaN until the first full window)
+    """
+    n = x.shape[0]
+    out = np.full_like(x, np.nan)
+
+    # Find first valid value
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if n - start < period:
+        return out
+
+    seed = 0.0
+    for i in range(start, start + period):
+        seed += x[i]
+    value = seed / period
+    out[start + period - 1] = value
+
+    alpha = 2.0 / (period + 1)
+    for i in range(start + period, n):
+        value = alpha * x[i] + (1.0 - alpha) * value
+        out[i] = value
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rsi(close, period):
+    """
+    Relative Strength Index using Wilder's running average.
+
+    Args:
+        close: Close prices
+        period: RSI period
+
+    Returns:
+        Array with RSI values (NaN until enough data is available)
+    """
+    n = close.shape[0]
+    out = np.full_like(close, np.nan)
+    alpha = 1.0 / period
+    decay = 1.0 - alpha
+
+    gain_num = 0.0
+    loss_num = 0.0
+    weight = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        # Adjusted exponential weighting, as pandas ewm(adjust=True)
+        gain_num = gain + decay * gain_num
+        loss_num = loss + decay * loss_num
+        weight = 1.0 + decay * weight
+
+        if i >= period:
+            avg_gain = gain_num / weight
+            avg_loss = loss_num / weight
+            total = avg_gain + avg_loss
+            if total != 0.0:
+                out[i] = 100.0 * avg_gain / total
+    return out
+
+
+@njit(cache=True, nogil=True)
+def macd(close, fast, slow, signal):
+    """
+    Moving Average Convergence Divergence.
+
+    The fast, slow and signal EMAs are carried through a single pass over
+    the close prices, each seeded with the SMA of its first window as in
+    ema().
+
+    Args:
+        close: Close prices
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal EMA period
+
+    Returns:
+        Tuple of (MACD line, signal line, histogram)
+    """
+    if fast > slow:
+        fast, slow = slow, fast
+
+    n = close.shape[0]
+    line = np.full_like(close, np.nan)
+    signal_line = np.full_like(close, np.nan)
+    histogram = np.full_like(close, np.nan)
+
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_signal = 0.0
+    for i in range(n):
+        price = close[i]
+
+        # Each EMA accumulates its SMA seed until its first window is full
+        if i < fast:
+            ema_fast += price
+            if i == fast - 1:
+                ema_fast /= fast
+        else:
+            ema_fast = alpha_fast * price + (1.0 - alpha_fast) * ema_fast
+
+        if i < slow:
+            ema_slow += price
+            if i == slow - 1:
+                ema_slow /= slow
+        else:
+            ema_slow = alpha_slow * price + (1.0 - alpha_slow) * ema_slow
+
+        if i < slow - 1:
+            continue
+
+        value = ema_fast - ema_slow
+        line[i] = value
+
+        # The signal EMA runs over the MACD line, which starts at slow - 1
+        j = i - (slow - 1)
+        if j < signal:
+            ema_signal += value
+            if j < signal - 1:
+                continue
+            ema_signal /= signal
+        else:
+            ema_signal = alpha_signal * value + (1.0 - alpha_signal) * ema_signal
+
+        signal_line[i] = ema_signal
+        histogram[i] = value - ema_signal
+    return line, signal_line, histogram
+
+
+@njit(cache=True, nogil=True)
+def bollinger_bands(close, period, std_dev):
+    """
+    Bollinger Bands around a simple moving average.
+
+    The window mean and variance come from running sums that are updated as
+    the window slides, so each candle is visited once.
+
+    Args:
+        close: Close prices
+        period: Window length
+        std_dev: Number of (population) standard deviations
+
+    Returns:
+        Tuple of (upper band, middle band, lower band)
+    """
+    n = close.shape[0]
+    upper = np.full_like(close, np.nan)
+    middle = np.full_like(close, np.nan)
+    lower = np.full_like(close, np.nan)
+    if n < period:
+        return upper, middle, lower
+
+    # Sums are taken relative to the first close to avoid cancellation in
+    # E[x^2] - E[x]^2 at large price levels
+    offset = close[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        d = close[i] - offset
+        total += d
+        total_sq += d * d
+        if i >= period:
+            d_old = close[i - period] - offset
+            total -= d_old
+            total_sq -= d_old * d_old
+        if i < period - 1:
+            continue
+
+        mean = total / period
+        var = total_sq / period - mean * mean
+        if var < 0.0:
+            var = 0.0
+        deviation = std_dev * np.sqrt(var)
+
+        middle[i] = offset + mean
+        upper[i] = middle[i] + deviation
+        lower[i] = middle[i] - deviation
+    return upper, middle, lower
+
+
+@njit(cache=True, nogil=True)
+def stochastic(high, low, close, k_period, d_period, smooth_k):
+    """
+    Stochastic Oscillator with SMA smoothing.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        k_period: Lookback for the highest high and lowest low
+        d_period: SMA period of %D
+        smooth_k: SMA period of %K
+
+    Returns:
+        Tuple of (%K, %D)
+    """
+    n = close.shape[0]
+    raw = np.full_like(close, np.nan)
+
+    for i in range(k_period - 1, n):
+        highest = high[i]
+        lowest = low[i]
+        for j in range(i - k_period + 1, i):
+            if high[j] > highest:
+                highest = high[j]
+            if low[j] < lowest:
+                lowest = low[j]
+
+        # Flat windows would divide by zero
+        price_range = highest - lowest
+        if price_range == 0.0:
+            price_range = np.finfo(np.float64).eps
+        raw[i] = 100.0 * (close[i] - lowest) / price_range
+
+    k = sma(raw, smooth_k)
+    d = sma(k, d_period)
+    return k, d
+
+
+@njit(cache=True, nogil=True)
+def atr(high, low, close, period):
+    """
+    Average True Range using Wilder's running average.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: ATR period
+
+    Returns:
+        Array with ATR values (NaN until enough data is available)
+    """
+    n = close.shape[0]
+    out = np.full_like(close, np.nan)
+    decay = 1.0 - 1.0 / period
+
+    # True range needs the previous close, so it starts at the second candle
+    tr_num = 0.0
+    weight = 0.0
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        up = abs(high[i] - close[i - 1])
+        down = abs(low[i] - close[i - 1])
+        if up > tr:
+            tr = up
+        if down > tr:
+            tr = down
+
+        # Adjusted exponential weighting, as pandas ewm(adjust=True)
+        tr_num = tr + decay * tr_num
+        weight = 1.0 + decay * weight
+
+        if i >= period:
+            out[i] = tr_num / weight
+    return out
+
+
+@njit(cache=True, nogil=True)
+def obv(close, volume):
+    """
+    On-Balance Volume.
+
+    Args:
+        close: Close prices
+        volume: Volumes
+
+    Returns:
+        float64 array with the running OBV (the first candle counts as up)
+    """
+    # A running total of volumes loses precision quickly in float32, so the
+    # output stays float64 whatever the input dtype
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    total = float(volume[0])
+    out[0] = total
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            total += volume[i]
+        elif close[i] < close[i - 1]:
+            total -= volume[i]
+        out[i] = total
+    return out
+
+
+@njit(cache=True, nogil=True)
+def signal_strength(rsi_oversold, rsi_overbought, macd_bullish, macd_bearish,
+                    bb_lower_touch, bb_upper_touch, stoch_bullish, stoch_bearish,
+                    stoch_k, high_volume):
+    """
+    Score each candle from the indicator flags used by the custom strategy.
+
+    Args:
+        rsi_oversold, rsi_overbought: RSI threshold flags
+        macd_bullish, macd_bearish: MACD crossover flags
+        bb_lower_touch, bb_upper_touch: Bollinger Band touch flags
+        stoch_bullish, stoch_bearish: Stochastic crossover flags
+        stoch_k: Stochastic %K values
+        high_volume: High volume flags
+
+    Returns:
+        Array with signal strength, positive for buy and negative for sell
+    """
+    n = rsi_oversold.shape[0]
+    out = np.zeros(n, dtype=np.int64)
+
+    for i in range(n):
+        s = 0
+        s += int(rsi_oversold[i]) - int(rsi_overbought[i])
+        s += int(macd_bullish[i]) - int(macd_bearish[i])
+        s += int(bb_lower_touch[i]) - int(bb_upper_touch[i])
+
+        # Stochastic crossovers only count in the oversold/overbought regions
+        if stoch_bullish[i] and stoch_k[i] < 30:
+            s += 1
+        if stoch_bearish[i] and stoch_k[i] > 70:
+            s -= 1
+
+        # High volume confirms the existing direction
+        if high_volume[i]:
+            if s > 0:
+                s += 1
+            elif s < 0:
+                s -= 1
+        out[i] = s
+    return out
+
+
+@njit(cache=True, nogil=True)
+def score_indicators(rsi, macd, macd_signal, low, bb_lower, high, bb_upper,
+                     sma_short, sma_long, ema_short, ema_long, stoch_k, stoch_d,
+                     volume, volume_sma):
+    """
+    Score each candle from raw indicator values, as used by SignalGenerator.
+
+    Crossovers are detected from the current and previous values, so no flag
+    columns are needed. NaN inputs fail every comparison and add nothing.
+
+    Args:
+        rsi: RSI values
+        macd, macd_signal: MACD line and signal line
+        low, bb_lower: Low prices and lower Bollinger Band
+        high, bb_upper: High prices and upper Bollinger Band
+        sma_short, sma_long: Short and long simple moving averages
+        ema_short, ema_long: Short and long exponential moving averages
+        stoch_k, stoch_d: Stochastic %K and %D
+        volume, volume_sma: Volumes and their moving average
+
+    Returns:
+        Array with signal strength, positive for buy and negative for sell
+    """
+    n = rsi.shape[0]
+    out = np.zeros(n, dtype=np.int64)
+
+    for i in range(n):
+        s = 0
+        s += int(rsi[i] < 30) - int(rsi[i] > 70)
+        s += int(low[i] <= bb_lower[i]) - int(high[i] >= bb_upper[i])
+
+        if i > 0:
+            j = i - 1
+            s += (int(macd[i] > macd_signal[i] and macd[j] <= macd_signal[j])
+                  - int(macd[i] < macd_signal[i] and macd[j] >= macd_signal[j]))
+            s += (int(sma_short[i] > sma_long[i] and sma_short[j] <= sma_long[j])
+                  - int(sma_short[i] < sma_long[i] and sma_short[j] >= sma_long[j]))
+            s += (int(ema_short[i] > ema_long[i] and ema_short[j] <= ema_long[j])
+                  - int(ema_short[i] < ema_long[i] and ema_short[j] >= ema_long[j]))
+
+            # Stochastic crossovers only count in the oversold/overbought regions
+            s += (int(stoch_k[i] > stoch_d[i] and stoch_k[j] <= stoch_d[j] and stoch_k[i] < 30)
+                  - int(stoch_k[i] < stoch_d[i] and stoch_k[j] >= stoch_d[j] and stoch_k[i] > 70))
+
+        # High volume confirms the existing direction
+        if volume[i] > volume_sma[i] * 1.5:
+            if s > 0:
+                s += 1
+            elif s < 0:
+                s -= 1
+        out[i] = s
+    return out
+
+
+def warmup(dtype=np.float64):
+    """
+    Compile (or load from the on-disk cache) every kernel for the given dtype.
+
+    Numba compiles on the first call, which can take seconds; calling this at
+    startup keeps that delay out of the first trading cycle. Does nothing
+    when numba is not installed.
+
+    Args:
+        dtype: Float dtype the indicators will be computed in
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    # A few candles are enough; the argument types are what select the compiled version
+    x = np.linspace(1.0, 2.0, 8).astype(dtype)
+    flags = np.zeros(8, dtype=np.bool_)
+
+    sma(x, 2)
+    ema(x, 2)
+    rsi(x, 2)
+    macd(x, 2, 3, 2)
+    bollinger_bands(x, 2, 2.0)
+    stochastic(x, x, x, 2, 2, 2)
+    atr(x, x, x, 2)
+    obv(x, x)
+    signal_strength(flags, flags, flags, flags, flags, flags, flags, flags, x, flags)
+
+    # SignalGenerator always passes float64 columns
+    y = x.astype(np.float64)
+    score_indicators(y, y, y, y, y, y, y, y, y, y, y, y, y, y, y)
@@ -7,6 +7,8 @@ from typing import Dict, List, Any, Optional
 import pandas as pd
 import numpy as np
 
+from src.strategy import kernels
+
 logger = logging.getLogger(__name__)
 
 class SignalGenerator:
@@ -23,6 +25,22 @@ class SignalGenerator:
         """
         self.config = config
         self.signal_threshold = config.get('strategy', 'signal_threshold', default=3)
+        
+        # Indicator columns read by the scoring kernel, in its argument order
+        rsi_period = config.get('strategy', 'rsi_period')
+        sma_short_period = config.get('strategy', 'sma_short_period')
+        sma_long_period = config.get('strategy', 'sma_long_period')
+        ema_short_period = config.get('strategy', 'ema_short_period')
+        ema_long_period = config.get('strategy', 'ema_long_period')
+        self._score_columns = (f'RSI_{rsi_period}',
+                               'MACD', 'MACD_Signal',
+                               'Low', 'BB_Lower',
+                               'High', 'BB_Upper',
+                               f'SMA_{sma_short_period}', f'SMA_{sma_long_period}',
+                               f'EMA_{ema_short_period}', f'EMA_{ema_long_period}',
+                               'Stoch_K', 'Stoch_D',
+                               'Volume', 'Volume_SMA_20')
+        
         logger.info(f"Signal generator initialized with threshold: {self.signal_threshold}")
     
     def generate_signals(self, 
@@ -36,25 +54,28 @@ class SignalGenerator:
         Returns:
             DataFrame with added signal columns
         """
-        df = df.copy()
+        # Only new columns are added, so a shallow copy is enough; when the signal columns
+        # already exist, older pandas may overwrite them in the shared data, so copy deeply
+        deep = any(col in df.columns for col in ('Buy_Signal', 'Sell_Signal', 'Signal_Strength', 'Signal_Type'))
+        df = df.copy(deep=deep)
         
-        # Initialize signal columns
-        df['Buy_Signal'] = False
-        df['Sell_Signal'] = False
-        df['Signal_Strength'] = 0  # Scale from -5 to 5
-        
-        # Calculate signal strength based on indicators
+        # Calculate signal strength based on indicators (scale from -5 to 5)
         self._calculate_signal_strength(df)
         
         # Generate final signals based on signal strength
-        df['Buy_Signal'] = df['Signal_Strength'] >= self.signal_threshold
-        df['Sell_Signal'] = df['Signal_Strength'] <= -self.signal_threshold
-        
-        # Add signal metadata
-        df['Signal_Type'] = np.where(df['Buy_Signal'], 'buy', 
-                                    np.where(df['Sell_Signal'], 'sell', 'neutral'))
-        
-        logger.info(f"Generated signals: {df['Buy_Signal'].sum()} buy, {df['Sell_Signal'].sum()} sell")
+        strength = df['Signal_Strength'].to_numpy()
+        buy = strength >= self.signal_threshold
+        sell = strength <= -self.signal_threshold
+        df['Buy_Signal'] = buy
+        df['Sell_Signal'] = sell
+        
+        # Add signal metadata as a categorical (one byte per row); buy wins if both are set
+        codes = np.zeros(len(df), dtype=np.int8)
+        codes[sell] = 2
+        codes[buy] = 1
+        df['Signal_Type'] = pd.Categorical.from_codes(codes, categories=['neutral', 'buy', 'sell'])
+        
+        logger.info("Generated signals: %s buy, %s sell", np.count_nonzero(buy), np.count_nonzero(sell))
         return df
     
     def _calculate_signal_strength(self, 
@@ -68,64 +89,27 @@ class SignalGenerator:
         Returns:
             None (modifies df in-place)
         """
-        # RSI signals
-        rsi_period = self.config.get('strategy', 'rsi_period')
-        if f'RSI_{rsi_period}' in df.columns:
-            df['Signal_Strength'] += np.where(df[f'RSI_{rsi_period}'] < 30, 1, 0)  # Oversold (buy)
-            df['Signal_Strength'] -= np.where(df[f'RSI_{rsi_period}'] > 70, 1, 0)  # Overbought (sell)
-        
-        # MACD signals
-        if all(col in df.columns for col in ['MACD', 'MACD_Signal']):
-            # Bullish crossover (MACD crosses above signal line)
-            bullish_crossover = (df['MACD'] > df['MACD_Signal']) & (df['MACD'].shift(1) <= df['MACD_Signal'].shift(1))
-            df['Signal_Strength'] += np.where(bullish_crossover, 1, 0)
-            
-            # Bearish crossover (MACD crosses below signal line)
-            bearish_crossover = (df['MACD'] < df['MACD_Signal']) & (df['MACD'].shift(1) >= df['MACD_Signal'].shift(1))
-            df['Signal_Strength'] -= np.where(bearish_crossover, 1, 0)
-        
-        # Bollinger Bands signals
-        if all(col in df.columns for col in ['BB_Lower', 'BB_Upper', 'Close']):
-            # Price touches lower band (potential buy)
-            df['Signal_Strength'] += np.where(df['Low'] <= df['BB_Lower'], 1, 0)
-            
-            # Price touches upper band (potential sell)
-            df['Signal_Strength'] -= np.where(df['High'] >= df['BB_Upper'], 1, 0)
-        
-        # Moving Average signals
-        sma_short_period = self.config.get('strategy', 'sma_short_period')
-        sma_long_period = self.config.get('strategy', 'sma_long_period')
-        ema_short_period = self.config.get('strategy', 'ema_short_period')
-        ema_long_period = self.config.get('strategy', 'ema_long_period')
-        
-        for ma_pair in [(f'SMA_{sma_short_period}', f'SMA_{sma_long_period}'), (f'EMA_{ema_short_period}', f'EMA_{ema_long_period}')]:
-            short_ma, long_ma = ma_pair
-            if all(col in df.columns for col in [short_ma, long_ma]):
-                # Bullish crossover (short MA crosses above long MA)
-                ma_bullish = (df[short_ma] > df[long_ma]) & (df[short_ma].shift(1) <= df[long_ma].shift(1))
-                df['Signal_Strength'] += np.where(ma_bullish, 1, 0)
-                
-                # Bearish crossover (short MA crosses below long MA)
-                ma_bearish = (df[short_ma] < df[long_ma]) & (df[short_ma].shift(1) >= df[long_ma].shift(1))
-                df['Signal_Strength'] -= np.where(ma_bearish, 1, 0)
-        
-        # Stochastic signals
-        if all(col in df.columns for col in ['Stoch_K', 'Stoch_D']):
-            # Bullish crossover in oversold region
-            stoch_bullish = (df['Stoch_K'] > df['Stoch_D']) & (df['Stoch_K'].shift(1) <= df['Stoch_D'].shift(1)) & (df['Stoch_K'] < 30)
-            df['Signal_Strength'] += np.where(stoch_bullish, 1, 0)
-            
-            # Bearish crossover in overbought region
-            stoch_bearish = (df['Stoch_K'] < df['Stoch_D']) & (df['Stoch_K'].shift(1) >= df['Stoch_D'].shift(1)) & (df['Stoch_K'] > 70)
-            df['Signal_Strength'] -= np.where(stoch_bearish, 1, 0)
+        # Score every rule in a single compiled pass; a missing indicator reads as NaN,
+        # which fails every comparison, so its rules contribute nothing
+        df['Signal_Strength'] = kernels.score_indicators(
+            *(self._column_or_nan(df, col) for col in self._score_columns)
+        )
+    
+    @staticmethod
+    def _column_or_nan(df: pd.DataFrame, col: str) -> np.ndarray:
+        """
+        Get a column as a float array, or an all-NaN array if it is missing.
         
-        # Volume confirmation
-        if all(col in df.columns for col in ['Volume', 'Volume_SMA_20']):
-            high_volume = df['Volume'] > (df['Volume_SMA_20'] * 1.5)
+        Args:
+            df: DataFrame with indicators
+            col: Column name
             
-            # High volume confirms existing signals
-            df['Signal_Strength'] += np.where(high_volume & (df['Signal_Strength'] > 0), 1, 0)
-            df['Signal_Strength'] -= np.where(high_volume & (df['Signal_Strength'] < 0), 1, 0)
+        Returns:
+            Float array with one value per row
+        """
+        if col in df.columns:
+            return df[col].to_numpy(dtype=np.float64, copy=False)
+        return np.full(len(df), np.nan)
     
     def filter_signals(self, df: pd.DataFrame, min_strength: int = None) -> pd.DataFrame:
         """
@@ -141,13 +125,13 @@ class SignalGenerator:
         if min_strength is None:
             min_strength = self.signal_threshold
         
-        # Filter for rows with significant signals
-        mask = (df['Buy_Signal'] | df['Sell_Signal'])
+        # Filter for rows with significant signals, combining the masks as arrays in place
+        mask = df['Buy_Signal'].to_numpy() | df['Sell_Signal'].to_numpy()
         
         if min_strength > 0:
-            mask = mask & (df['Signal_Strength'].abs() >= min_strength)
+            mask &= np.abs(df['Signal_Strength'].to_numpy()) >= min_strength
         
         filtered_df = df[mask].copy()
         
-        logger.info(f"Filtered signals: {len(filtered_df)} significant signals")
+        logger.info("Filtered signals: %s significant signals", len(filtered_df))
         return filtered_df
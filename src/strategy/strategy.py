@@ -4,6 +4,7 @@ Base strategy interface for implementing trading strategies.
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
+import numpy as np
 import pandas as pd
 
 
@@ -66,12 +67,12 @@ class Strategy(ABC):
         pass
     
     @abstractmethod
-    def optimize_parameters(self, data: pd.DataFrame, **kwargs) -> Dict[str, Any]:
+    def optimize_parameters(self, data: np.ndarray, **kwargs) -> Dict[str, Any]:
         """
         Optimize strategy parameters.
         
         Args:
-            data: DataFrame with OHLCV data
+            data: Array of shape (n_candles, 5) with Open, High, Low, Close and Volume columns
             **kwargs: Additional parameters for optimization
             
         Returns:
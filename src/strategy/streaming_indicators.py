@@ -0,0 +1,342 @@
+"""
+Incremental indicators that are updated one candle at a time.
+
+Each class keeps only the state needed for its next value, so an update
+costs O(1) instead of recomputing the whole history. Values follow the
+batch kernels in src/strategy/kernels.py and are NaN until enough candles
+have been seen.
+"""
+
+import math
+import sys
+from collections import deque
+from typing import Tuple
+
+
+class StreamingSMA:
+    """
+    Simple moving average over a sliding window.
+    """
+
+    def __init__(self, period: int):
+        """
+        Initialize the SMA.
+
+        Args:
+            period: Window length
+        """
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+
+    def update(self, x: float) -> float:
+        """
+        Add a value.
+
+        Leading NaNs are skipped, as in the batch kernel, so the average can be
+        fed with the output of another indicator that is still warming up.
+
+        Args:
+            x: New value
+
+        Returns:
+            Current SMA value
+        """
+        if not self.window and math.isnan(x):
+            return math.nan
+
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(x)
+        self.total += x
+
+        if len(self.window) < self.period:
+            return math.nan
+        return self.total / self.period
+
+
+class StreamingEMA:
+    """
+    Exponential moving average seeded with the SMA of the first window.
+    """
+
+    def __init__(self, period: int):
+        """
+        Initialize the EMA.
+
+        Args:
+            period: EMA period
+        """
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.count = 0
+        self.value = 0.0
+
+    def update(self, x: float) -> float:
+        """
+        Add a value.
+
+        Args:
+            x: New value
+
+        Returns:
+            Current EMA value
+        """
+        self.count += 1
+
+        # Accumulate the SMA seed until the first window is full
+        if self.count <= self.period:
+            self.value += x
+            if self.count < self.period:
+                return math.nan
+            self.value /= self.period
+        else:
+            self.value = self.alpha * x + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index using Wilder's running average.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize the RSI.
+
+        Args:
+            period: RSI period
+        """
+        self.period = period
+        self.decay = 1.0 - 1.0 / period
+        self.count = 0
+        self.prev_close = math.nan
+        self.gain_num = 0.0
+        self.loss_num = 0.0
+        self.weight = 0.0
+
+    def update(self, close: float) -> float:
+        """
+        Add a close price.
+
+        Args:
+            close: New close price
+
+        Returns:
+            Current RSI value
+        """
+        self.count += 1
+        prev_close, self.prev_close = self.prev_close, close
+        if self.count == 1:
+            return math.nan
+
+        change = close - prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        # Adjusted exponential weighting, as pandas ewm(adjust=True)
+        self.gain_num = gain + self.decay * self.gain_num
+        self.loss_num = loss + self.decay * self.loss_num
+        self.weight = 1.0 + self.decay * self.weight
+
+        if self.count <= self.period:
+            return math.nan
+
+        avg_gain = self.gain_num / self.weight
+        avg_loss = self.loss_num / self.weight
+        total = avg_gain + avg_loss
+        if total == 0.0:
+            return math.nan
+        return 100.0 * avg_gain / total
+
+
+class StreamingMACD:
+    """
+    Moving Average Convergence Divergence.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        """
+        Initialize the MACD.
+
+        Args:
+            fast: Fast period
+            slow: Slow period
+            signal: Signal period
+        """
+        if fast > slow:
+            fast, slow = slow, fast
+        self.fast_ema = StreamingEMA(fast)
+        self.slow_ema = StreamingEMA(slow)
+        self.signal_ema = StreamingEMA(signal)
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """
+        Add a close price.
+
+        Args:
+            close: New close price
+
+        Returns:
+            Tuple of (MACD line, signal line, histogram)
+        """
+        fast = self.fast_ema.update(close)
+        slow = self.slow_ema.update(close)
+        if math.isnan(slow):
+            return math.nan, math.nan, math.nan
+
+        # The signal EMA only starts once the MACD line exists
+        line = fast - slow
+        signal = self.signal_ema.update(line)
+        return line, signal, line - signal
+
+
+class StreamingBB:
+    """
+    Bollinger Bands around a simple moving average.
+    """
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        """
+        Initialize the Bollinger Bands.
+
+        Args:
+            period: Window length
+            std_dev: Number of (population) standard deviations
+        """
+        self.period = period
+        self.std_dev = std_dev
+        self.window = deque(maxlen=period)
+        self.offset = math.nan
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """
+        Add a close price.
+
+        Args:
+            close: New close price
+
+        Returns:
+            Tuple of (upper band, middle band, lower band)
+        """
+        # Sums are taken relative to the first close, as in the batch kernel
+        if math.isnan(self.offset):
+            self.offset = close
+
+        if len(self.window) == self.period:
+            d_old = self.window[0] - self.offset
+            self.total -= d_old
+            self.total_sq -= d_old * d_old
+        self.window.append(close)
+
+        d = close - self.offset
+        self.total += d
+        self.total_sq += d * d
+
+        if len(self.window) < self.period:
+            return math.nan, math.nan, math.nan
+
+        mean = self.total / self.period
+        var = max(self.total_sq / self.period - mean * mean, 0.0)
+        deviation = self.std_dev * math.sqrt(var)
+        middle = self.offset + mean
+        return middle + deviation, middle, middle - deviation
+
+
+class StreamingATR:
+    """
+    Average True Range using Wilder's running average.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize the ATR.
+
+        Args:
+            period: ATR period
+        """
+        self.period = period
+        self.decay = 1.0 - 1.0 / period
+        self.count = 0
+        self.prev_close = math.nan
+        self.tr_num = 0.0
+        self.weight = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Add a candle.
+
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            Current ATR value
+        """
+        self.count += 1
+        prev_close, self.prev_close = self.prev_close, close
+        if self.count == 1:
+            return math.nan
+
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        # Adjusted exponential weighting, as pandas ewm(adjust=True)
+        self.tr_num = tr + self.decay * self.tr_num
+        self.weight = 1.0 + self.decay * self.weight
+
+        if self.count <= self.period:
+            return math.nan
+        return self.tr_num / self.weight
+
+
+class StreamingStochastic:
+    """
+    Stochastic Oscillator with SMA smoothing.
+    """
+
+    def __init__(self, k_period: int = 14, d_period: int = 3, smooth_k: int = 3):
+        """
+        Initialize the Stochastic Oscillator.
+
+        Args:
+            k_period: Lookback for the highest high and lowest low
+            d_period: SMA period of %D
+            smooth_k: SMA period of %K
+        """
+        self.k_period = k_period
+        self.highs = deque(maxlen=k_period)
+        self.lows = deque(maxlen=k_period)
+        self.k_sma = StreamingSMA(smooth_k)
+        self.d_sma = StreamingSMA(d_period)
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        """
+        Add a candle.
+
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            Tuple of (%K, %D)
+        """
+        self.highs.append(high)
+        self.lows.append(low)
+
+        raw = math.nan
+        if len(self.highs) == self.k_period:
+            highest = max(self.highs)
+            lowest = min(self.lows)
+
+            # Flat windows would divide by zero
+            price_range = highest - lowest
+            if price_range == 0.0:
+                price_range = sys.float_info.epsilon
+            raw = 100.0 * (close - lowest) / price_range
+
+        k = self.k_sma.update(raw)
+        return k, self.d_sma.update(k)
@@ -0,0 +1,29 @@
+"""
+Numba JIT helpers with a pure-Python fallback.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """
+        No-op replacement for numba.njit when numba is not installed.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+    
+    # The kernels are explicit loops, which are slow without compilation
+    logger.warning("Numba not available, JIT kernels will run as plain Python (much slower)")
@@ -7,6 +7,7 @@ import sys
 import logging
 import time
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 # Add the src directory to the Python path
@@ -199,5 +200,71 @@ def test_execution():
     logger.info("All execution tests passed!")
     return True
 
+def _batch_risk_manager(open_positions=0, daily_pnl=0.0):
+    """
+    Create a risk manager with fixed limits for the batch order checks.
+    """
+    config = ConfigManager(Path(__file__).parent.parent / "config" / "config.yaml")
+    risk_manager = RiskManager(config)
+    risk_manager.account_balance = 10000.0
+    risk_manager.max_position_size = 0.05  # 500 per position
+    risk_manager.max_open_positions = 3
+    risk_manager.max_daily_loss = 0.03  # 300 per day
+    risk_manager.bind_account_state(lambda: open_positions, lambda: daily_pnl)
+    return risk_manager
+
+def test_check_orders_batch_slots():
+    """
+    Orders rejected for size must not use up the remaining position slots.
+    """
+    risk_manager = _batch_risk_manager(open_positions=1)
+    
+    # Two slots left; the oversized first order leaves them to the next two
+    approved = risk_manager.check_orders_batch(
+        quantities=[1.0, 1.0, 1.0, 1.0],
+        prices=[600.0, 100.0, 100.0, 100.0]
+    )
+    assert approved.tolist() == [False, True, True, False]
+    
+    # An explicit count overrides the live one
+    approved = risk_manager.check_orders_batch([1.0, 1.0], [100.0, 100.0], open_positions=3)
+    assert approved.tolist() == [False, False]
+
+def test_check_orders_batch_size():
+    """
+    Orders sized exactly to the limit pass despite float rounding, larger ones don't.
+    """
+    risk_manager = _batch_risk_manager()
+    risk_manager.max_open_positions = 1000
+    
+    prices = np.linspace(0.01, 70000.0, 997)
+    quantities = [risk_manager.calculate_position_size("BTCUSDT", "LONG", price) for price in prices]
+    assert risk_manager.check_orders_batch(quantities, prices).all()
+    
+    approved = risk_manager.check_orders_batch([5.0, 5.01], [100.0, 100.0])
+    assert approved.tolist() == [True, False]
+
+def test_check_orders_batch_daily_loss():
+    """
+    Every order is rejected once the daily loss limit is exceeded.
+    """
+    risk_manager = _batch_risk_manager(daily_pnl=-300.0)
+    assert risk_manager.check_orders_batch([1.0, 1.0], [100.0, 100.0]).all()
+    
+    risk_manager = _batch_risk_manager(daily_pnl=-300.01)
+    assert not risk_manager.check_orders_batch([1.0, 1.0], [100.0, 100.0]).any()
+
+def test_check_orders_batch_nan_price():
+    """
+    Orders without a price skip the size check but still take a slot.
+    """
+    risk_manager = _batch_risk_manager(open_positions=2)
+    
+    approved = risk_manager.check_orders_batch([1000.0, 1.0], [np.nan, 100.0])
+    assert approved.tolist() == [True, False]
+    
+    approved = risk_manager.check_orders_batch([1000.0, 1.0], [None, 100.0])
+    assert approved.tolist() == [True, False]
+
 if __name__ == "__main__":
     test_execution()
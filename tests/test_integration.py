@@ -72,7 +72,7 @@ def test_integration():
             logger.info(f"Executed {len(executed_positions)} positions")
             
             # Step 6: Update positions with current prices
-            current_prices = {pair: historical_data[pair].iloc[-1]['Close'] for pair in trading_pairs if pair in historical_data}
+            current_prices = {pair: historical_data[pair]['Close'].to_numpy()[-1] for pair in trading_pairs if pair in historical_data}
             execution.update_positions(current_prices)
             logger.info("Updated positions with current prices")
             
@@ -87,7 +87,7 @@ def test_integration():
         
         # Step 9: Get performance metrics
         metrics = execution.get_performance_metrics()
-        logger.info(f"Performance metrics: {metrics}")
+        logger.info("Performance metrics: %s", metrics)
         
         logger.info("Complete trading workflow test passed")
     except Exception as e:
@@ -7,7 +7,9 @@ import sys
 import logging
 import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 # Add the src directory to the Python path
@@ -16,9 +18,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.config.config_manager import ConfigManager
 from src.logging.logger import setup_logger
 from src.data_collection.binance_data_provider import BinanceDataProvider
+from src.strategy import kernels
 from src.strategy.indicator_calculator import IndicatorCalculator
 from src.strategy.custom_strategy import CustomStrategy
 from src.strategy.signal_generator import SignalGenerator
+from src.strategy.streaming_indicators import (StreamingATR, StreamingBB, StreamingEMA, StreamingMACD,
+                                               StreamingRSI, StreamingSMA, StreamingStochastic)
 
 def test_strategy():
     """
@@ -50,18 +55,21 @@ def test_strategy():
         now = dt.datetime.now(dt.timezone.utc)
         past = now - dt.timedelta(days=7)
                   
-        # Get historical data for each symbol
-        historical_data = {}
-        for symbol in symbols:
-            data = data_provider.get_historical_data(
+        # Get historical data for each symbol; the requests are I/O bound, so run them concurrently
+        def fetch(symbol):
+            return data_provider.get_historical_data(
                 symbol=symbol,
                 interval='1h',
                 limit=7 * 24,
                 start_time=past,  # Last 7 days
                 end_time=now  # Current time
             )
-            historical_data[symbol] = data
-            logger.info(f"Retrieved {len(data)} candles for {symbol}")
+        
+        historical_data = {}
+        with ThreadPoolExecutor(max_workers=max(len(symbols), 1)) as pool:
+            for symbol, data in zip(symbols, pool.map(fetch, symbols)):
+                historical_data[symbol] = data
+                logger.info("Retrieved %s candles for %s", len(data), symbol)
         
         if not historical_data:
             logger.error("Failed to get historical data")
@@ -71,14 +79,21 @@ def test_strategy():
         return False
     
     # Test indicator calculation
+    # The indicator frames are kept so the signal generator test can reuse them
+    indicator_data = {}
     try:
         logger.info("Testing indicator calculation...")
         
         for symbol, data in historical_data.items():
-            # Calculate indicators
+            # Calculate indicators, timing the call so slowdowns show up in the test log
+            start = time.perf_counter()
             data_with_indicators = indicator_calculator.add_all_indicators(data)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            indicator_data[symbol] = data_with_indicators
+            logger.info("Calculated indicators for %s (%s candles) in %.2f ms", symbol, len(data), elapsed_ms)
             
-            logger.info(f"Calculated indicators for {symbol}: {data_with_indicators.columns.tolist()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calculated indicators for %s: %s", symbol, data_with_indicators.columns.tolist())
             
             # Check if indicators were calculated
             expected_indicators = ['SMA_20', 'EMA_20', 'RSI_14', 'MACD', 'BB_Upper', 'Stoch_K', 'ATR_14']
@@ -87,7 +102,7 @@ def test_strategy():
                     logger.error(f"Indicator {indicator} not found in calculated indicators")
                     return False
             
-            logger.info(f"Indicator calculation for {symbol} passed")
+            logger.info("Indicator calculation for %s passed", symbol)
         
         logger.info("All indicator calculations passed")
     except Exception as e:
@@ -98,10 +113,13 @@ def test_strategy():
     try:
         logger.info("Testing strategy signal generation...")
         
-        for symbol, data in historical_data.items():
-            # Calculate indicators
-            data_with_indicators = custom_strategy.calculate_indicators(data)
-            
+        # Calculate indicators for all symbols in parallel
+        start = time.perf_counter()
+        strategy_indicators = custom_strategy.calculate_indicators_batch(historical_data)
+        logger.info("Calculated strategy indicators for %s symbols in %.2f ms",
+                    len(strategy_indicators), (time.perf_counter() - start) * 1000)
+        
+        for symbol, data_with_indicators in strategy_indicators.items():
             # Generate signals
             data_with_signals = custom_strategy.generate_signals(data_with_indicators)
             
@@ -111,22 +129,22 @@ def test_strategy():
                 return False
             
             # Count signals
-            buy_signals = data_with_signals['Buy_Signal'].sum()
-            sell_signals = data_with_signals['Sell_Signal'].sum()
+            buy_signals = np.count_nonzero(data_with_signals['Buy_Signal'].to_numpy())
+            sell_signals = np.count_nonzero(data_with_signals['Sell_Signal'].to_numpy())
             
-            logger.info(f"Generated signals for {symbol}: {buy_signals} buy, {sell_signals} sell")
+            logger.info("Generated signals for %s: %s buy, %s sell", symbol, buy_signals, sell_signals)
             
             # Get entry points
             entry_points = custom_strategy.get_entry_points(data_with_signals)
-            logger.info(f"Found {len(entry_points)} entry points for {symbol}")
+            logger.info("Found %s entry points for %s", len(entry_points), symbol)
             
             # Test exit points for a sample position
             if entry_points:
                 sample_position = entry_points[0]
                 exit_points = custom_strategy.get_exit_points(data_with_signals, sample_position)
-                logger.info(f"Found {len(exit_points)} exit points for sample position")
+                logger.info("Found %s exit points for sample position", len(exit_points))
             
-            logger.info(f"Strategy signal generation for {symbol} passed")
+            logger.info("Strategy signal generation for %s passed", symbol)
         
         logger.info("All strategy signal generation tests passed")
     except Exception as e:
@@ -137,19 +155,16 @@ def test_strategy():
     try:
         logger.info("Testing signal generator...")
         
-        for symbol, data in historical_data.items():
-            # Calculate indicators
-            data_with_indicators = indicator_calculator.add_all_indicators(data)
-            
-            # Generate signals
+        for symbol, data_with_indicators in indicator_data.items():
+            # Generate signals from the indicators calculated above
             data_with_signals = signal_generator.generate_signals(data_with_indicators)
             
             # Filter signals
             filtered_signals = signal_generator.filter_signals(data_with_signals)
             
-            logger.info(f"Generated and filtered signals for {symbol}: {len(filtered_signals)} significant signals")
+            logger.info("Generated and filtered signals for %s: %s significant signals", symbol, len(filtered_signals))
             
-            logger.info(f"Signal generator test for {symbol} passed")
+            logger.info("Signal generator test for %s passed", symbol)
         
         logger.info("All signal generator tests passed")
     except Exception as e:
@@ -159,5 +174,254 @@ def test_strategy():
     logger.info("All strategy tests passed!")
     return True
 
+def _candles(n=300, seed=7):
+    """
+    Build a fixed random-walk OHLCV frame for the offline indicator tests.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    spread = np.abs(rng.normal(0.0, 0.005, n))
+    return pd.DataFrame({
+        'High': close * (1.0 + spread),
+        'Low': close * (1.0 - spread),
+        'Close': close,
+        'Volume': rng.uniform(100.0, 1000.0, n),
+    })
+
+def _warmup_length(values):
+    """
+    Number of leading NaNs in an indicator output.
+    """
+    return int(np.argmax(~np.isnan(values)))
+
+def _reference_ema(series, period):
+    """
+    pandas_ta EMA: SMA of the first window, then ewm(adjust=False), skipping leading NaNs.
+    """
+    values = series.dropna()
+    seeded = values.copy()
+    seeded.iloc[:period - 1] = np.nan
+    seeded.iloc[period - 1] = values.iloc[:period].mean()
+    return seeded.ewm(span=period, adjust=False).mean().reindex(series.index)
+
+def _reference_rma(series, period):
+    """
+    pandas_ta RMA: Wilder's average as ewm(adjust=True).
+    """
+    return series.ewm(alpha=1.0 / period, min_periods=period).mean()
+
+def test_ema_kernel():
+    """
+    The EMA kernel matches the SMA-seeded pandas EMA, including after leading NaNs.
+    """
+    close = _candles()['Close']
+    for period in (9, 20, 50):
+        ema = kernels.ema(close.to_numpy(), period)
+        assert _warmup_length(ema) == period - 1
+        np.testing.assert_allclose(ema, _reference_ema(close, period), rtol=1e-10, equal_nan=True)
+    
+    delayed = pd.concat([pd.Series([np.nan] * 5), close], ignore_index=True)
+    ema = kernels.ema(delayed.to_numpy(), 9)
+    assert _warmup_length(ema) == 5 + 9 - 1
+    np.testing.assert_allclose(ema, _reference_ema(delayed, 9), rtol=1e-10, equal_nan=True)
+
+def test_rsi_kernel():
+    """
+    The RSI kernel matches pandas_ta's RSI built on the adjusted RMA.
+    """
+    close = _candles()['Close']
+    change = close.diff()
+    avg_gain = _reference_rma(change.clip(lower=0.0), 14)
+    avg_loss = _reference_rma((-change).clip(lower=0.0), 14)
+    expected = 100.0 * avg_gain / (avg_gain + avg_loss)
+    
+    rsi = kernels.rsi(close.to_numpy(), 14)
+    assert _warmup_length(rsi) == 14
+    np.testing.assert_allclose(rsi, expected, rtol=1e-10, equal_nan=True)
+
+def test_macd_kernel():
+    """
+    The MACD kernel matches the difference of SMA-seeded EMAs and its signal EMA.
+    """
+    close = _candles()['Close']
+    line = _reference_ema(close, 12) - _reference_ema(close, 26)
+    signal = _reference_ema(line, 9)
+    
+    macd, macd_signal, histogram = kernels.macd(close.to_numpy(), 12, 26, 9)
+    assert _warmup_length(macd) == 25
+    assert _warmup_length(macd_signal) == 25 + 8
+    np.testing.assert_allclose(macd, line, rtol=1e-9, atol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(macd_signal, signal, rtol=1e-9, atol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(histogram, line - signal, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+def test_bollinger_bands_kernel():
+    """
+    The Bollinger Bands kernel matches a rolling mean and population standard deviation.
+    """
+    close = _candles()['Close']
+    middle = close.rolling(20).mean()
+    deviation = 2.0 * close.rolling(20).std(ddof=0)
+    
+    upper, mid, lower = kernels.bollinger_bands(close.to_numpy(), 20, 2.0)
+    assert _warmup_length(mid) == 19
+    np.testing.assert_allclose(mid, middle, rtol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(upper, middle + deviation, rtol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(lower, middle - deviation, rtol=1e-10, equal_nan=True)
+
+def test_signal_strength_kernel():
+    """
+    The signal strength kernel matches the flag arithmetic it replaced.
+    """
+    rng = np.random.default_rng(11)
+    flags = [rng.random(500) < 0.3 for _ in range(8)]
+    stoch_k = rng.uniform(0.0, 100.0, 500)
+    high_volume = rng.random(500) < 0.3
+    
+    (rsi_oversold, rsi_overbought, macd_bullish, macd_bearish,
+     bb_lower_touch, bb_upper_touch, stoch_bullish, stoch_bearish) = [f.astype(np.int64) for f in flags]
+    expected = (rsi_oversold - rsi_overbought + macd_bullish - macd_bearish
+                + bb_lower_touch - bb_upper_touch
+                + (flags[6] & (stoch_k < 30)) - (flags[7] & (stoch_k > 70)))
+    expected = expected + np.sign(expected) * high_volume
+    
+    strength = kernels.signal_strength(*flags, stoch_k, high_volume)
+    assert strength.dtype == np.int64
+    np.testing.assert_array_equal(strength, expected)
+
+def test_sma_kernel():
+    """
+    The SMA kernel matches a rolling mean, skips leading NaNs and keeps the input dtype.
+    """
+    close = _candles()['Close']
+    sma = kernels.sma(close.to_numpy(), 20)
+    assert _warmup_length(sma) == 19
+    np.testing.assert_allclose(sma, close.rolling(20).mean(), rtol=1e-10, equal_nan=True)
+    
+    delayed = pd.concat([pd.Series([np.nan] * 5), close], ignore_index=True)
+    sma = kernels.sma(delayed.to_numpy(), 20)
+    assert _warmup_length(sma) == 5 + 19
+    np.testing.assert_allclose(sma, delayed.rolling(20).mean(), rtol=1e-10, equal_nan=True)
+    
+    assert kernels.sma(close.to_numpy(np.float32), 20).dtype == np.float32
+
+def test_stochastic_kernel():
+    """
+    The Stochastic kernel matches pandas_ta's rolling range and SMA smoothing.
+    """
+    df = _candles()
+    lowest = df['Low'].rolling(14).min()
+    highest = df['High'].rolling(14).max()
+    raw = 100.0 * (df['Close'] - lowest) / (highest - lowest)
+    expected_k = raw.rolling(3).mean()
+    expected_d = expected_k.rolling(3).mean()
+    
+    k, d = kernels.stochastic(df['High'].to_numpy(), df['Low'].to_numpy(), df['Close'].to_numpy(), 14, 3, 3)
+    assert _warmup_length(k) == 13 + 2
+    assert _warmup_length(d) == 13 + 2 + 2
+    np.testing.assert_allclose(k, expected_k, rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(d, expected_d, rtol=1e-9, equal_nan=True)
+
+def test_atr_kernel():
+    """
+    The ATR kernel matches the adjusted RMA of the true range.
+    """
+    df = _candles()
+    prev_close = df['Close'].shift()
+    true_range = pd.concat([df['High'] - df['Low'],
+                            (df['High'] - prev_close).abs(),
+                            (df['Low'] - prev_close).abs()], axis=1).max(axis=1, skipna=False)
+    
+    atr = kernels.atr(df['High'].to_numpy(), df['Low'].to_numpy(), df['Close'].to_numpy(), 14)
+    assert _warmup_length(atr) == 14
+    np.testing.assert_allclose(atr, _reference_rma(true_range, 14), rtol=1e-10, equal_nan=True)
+
+def test_obv_kernel():
+    """
+    The OBV kernel matches the cumulative signed volume, counting the first candle as up.
+    """
+    df = _candles()
+    df.loc[10, 'Close'] = df.loc[9, 'Close']  # an unchanged close adds nothing
+    expected = (np.sign(df['Close'].diff()).fillna(1.0) * df['Volume']).cumsum()
+    
+    obv = kernels.obv(df['Close'].to_numpy(np.float32), df['Volume'].to_numpy(np.float32))
+    assert obv.dtype == np.float64
+    np.testing.assert_allclose(obv, expected, rtol=1e-6)
+
+def test_score_indicators_kernel():
+    """
+    The score kernel matches the pandas crossover rules it replaced, NaN warm-ups included.
+    """
+    df = _candles()
+    close, high, low, volume = (df[col].to_numpy() for col in ('Close', 'High', 'Low', 'Volume'))
+    df['RSI'] = kernels.rsi(close, 14)
+    df['MACD'], df['MACD_Signal'], _ = kernels.macd(close, 12, 26, 9)
+    df['BB_Upper'], _, df['BB_Lower'] = kernels.bollinger_bands(close, 20, 2.0)
+    df['SMA_Short'], df['SMA_Long'] = kernels.sma(close, 5), kernels.sma(close, 10)
+    df['EMA_Short'], df['EMA_Long'] = kernels.ema(close, 5), kernels.ema(close, 10)
+    df['Stoch_K'], df['Stoch_D'] = kernels.stochastic(high, low, close, 14, 3, 3)
+    df['Volume_SMA'] = kernels.sma(volume, 20)
+    
+    def cross_up(a, b):
+        return (df[a] > df[b]) & (df[a].shift(1) <= df[b].shift(1))
+    
+    def cross_down(a, b):
+        return (df[a] < df[b]) & (df[a].shift(1) >= df[b].shift(1))
+    
+    expected = ((df['RSI'] < 30).astype(int) - (df['RSI'] > 70).astype(int)
+                + cross_up('MACD', 'MACD_Signal').astype(int) - cross_down('MACD', 'MACD_Signal').astype(int)
+                + (df['Low'] <= df['BB_Lower']).astype(int) - (df['High'] >= df['BB_Upper']).astype(int)
+                + cross_up('SMA_Short', 'SMA_Long').astype(int) - cross_down('SMA_Short', 'SMA_Long').astype(int)
+                + cross_up('EMA_Short', 'EMA_Long').astype(int) - cross_down('EMA_Short', 'EMA_Long').astype(int)
+                + (cross_up('Stoch_K', 'Stoch_D') & (df['Stoch_K'] < 30)).astype(int)
+                - (cross_down('Stoch_K', 'Stoch_D') & (df['Stoch_K'] > 70)).astype(int))
+    high_volume = df['Volume'] > df['Volume_SMA'] * 1.5
+    expected = expected + np.sign(expected) * high_volume
+    
+    strength = kernels.score_indicators(
+        *(df[col].to_numpy() for col in ('RSI', 'MACD', 'MACD_Signal', 'Low', 'BB_Lower', 'High', 'BB_Upper',
+                                         'SMA_Short', 'SMA_Long', 'EMA_Short', 'EMA_Long', 'Stoch_K', 'Stoch_D',
+                                         'Volume', 'Volume_SMA'))
+    )
+    assert strength.dtype == np.int64
+    assert np.count_nonzero(strength) > 0
+    np.testing.assert_array_equal(strength, expected.to_numpy())
+
+def test_streaming_indicators_match_kernels():
+    """
+    Feeding candles one at a time gives the same values as the batch kernels.
+    """
+    df = _candles()
+    high, low, close = (df[col].to_numpy() for col in ('High', 'Low', 'Close'))
+    
+    sma = StreamingSMA(20)
+    ema = StreamingEMA(20)
+    rsi = StreamingRSI(14)
+    macd = StreamingMACD(12, 26, 9)
+    bb = StreamingBB(20, 2.0)
+    atr = StreamingATR(14)
+    stochastic = StreamingStochastic(14, 3, 3)
+    streamed = {name: [] for name in ('SMA', 'EMA', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist',
+                                      'BB_Upper', 'BB_Middle', 'BB_Lower', 'ATR', 'Stoch_K', 'Stoch_D')}
+    for h, l, c in zip(high, low, close):
+        streamed['SMA'].append(sma.update(c))
+        streamed['EMA'].append(ema.update(c))
+        streamed['RSI'].append(rsi.update(c))
+        for name, value in zip(('MACD', 'MACD_Signal', 'MACD_Hist'), macd.update(c)):
+            streamed[name].append(value)
+        for name, value in zip(('BB_Upper', 'BB_Middle', 'BB_Lower'), bb.update(c)):
+            streamed[name].append(value)
+        streamed['ATR'].append(atr.update(h, l, c))
+        for name, value in zip(('Stoch_K', 'Stoch_D'), stochastic.update(h, l, c)):
+            streamed[name].append(value)
+    
+    batch = {'SMA': kernels.sma(close, 20), 'EMA': kernels.ema(close, 20), 'RSI': kernels.rsi(close, 14),
+             'ATR': kernels.atr(high, low, close, 14)}
+    batch['MACD'], batch['MACD_Signal'], batch['MACD_Hist'] = kernels.macd(close, 12, 26, 9)
+    batch['BB_Upper'], batch['BB_Middle'], batch['BB_Lower'] = kernels.bollinger_bands(close, 20, 2.0)
+    batch['Stoch_K'], batch['Stoch_D'] = kernels.stochastic(high, low, close, 14, 3, 3)
+    
+    for name, values in streamed.items():
+        np.testing.assert_allclose(values, batch[name], rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=name)
+
 if __name__ == "__main__":
     test_strategy()